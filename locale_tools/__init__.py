@@ -0,0 +1,12 @@
+"""
+Locale toolchain for src/i18n/locales.
+
+Applies the patch sets under src/i18n/patches with a single engine that
+loads every locale once, applies every patch set in memory and writes each
+file once. Run it with ``python -m locale_tools``.
+"""
+
+from .engine import sync
+from .patches import discover_patch_sets
+
+__all__ = ["sync", "discover_patch_sets"]
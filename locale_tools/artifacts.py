@@ -0,0 +1,140 @@
+"""
+Content-hashed, precompressed locale artifacts for CDN caching.
+
+Each locale (or, with namespaces, each namespace chunk) is written minified
+as ``<lang>.<hash>.json`` next to a gzip and, when the ``brotli`` package is
+installed, a brotli variant. The hash only changes with the content, so the
+files can be served with an immutable cache policy and a browser downloads a
+language again only after its strings changed. ``manifest.json`` maps every
+language to its hashed URLs and sizes; it is the one file that must not be
+cached immutably.
+
+Compression is deterministic (gzip without a timestamp), so rebuilding
+unchanged locales leaves every artifact byte-identical. A rebuild removes
+only earlier artifacts, recognised by their hashed names; other files in the
+directory are never touched.
+"""
+
+import gzip
+import json
+import os
+import re
+
+from .config import ARTIFACT_DIR, LOCALE_DIR
+from .engine import discover_languages, dump_compact, load_locale, locale_path, write_if_changed
+from .manifest import content_hash, file_hash
+from .split import split_locale
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ARTIFACT_MANIFEST_NAME = "manifest.json"
+
+# URL prefix the artifact directory is served under
+ARTIFACT_URL = "/i18n/"
+
+# Hash characters kept in artifact filenames
+HASH_LENGTH = 12
+
+# Relative path of a built artifact: <lang>[/<namespace>].<hash>.json[.gz|.br]
+ARTIFACT_NAME_RE = re.compile(rf"[\w-]+(?:/[\w-]+)?\.[0-9a-f]{{{HASH_LENGTH}}}\.json(?:\.gz|\.br)?")
+
+
+def _write_bytes_if_changed(path, data):
+    if file_hash(path) == content_hash(data):
+        return False
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def write_artifact(out_dir, stem, data, use_brotli=False):
+    """
+    Write one minified, hashed artifact and its compressed variants.
+    Returns the manifest entry and the names of the files written.
+    """
+    text = dump_compact(data)
+    raw = text.encode("utf-8")
+    name = f"{stem}.{content_hash(text)[:HASH_LENGTH]}.json"
+    path = os.path.join(out_dir, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    written = []
+    if write_if_changed(path, text):
+        written.append(name)
+    entry = {"url": ARTIFACT_URL + name.replace(os.sep, "/"), "bytes": len(raw)}
+
+    compressed = gzip.compress(raw, compresslevel=9, mtime=0)
+    if _write_bytes_if_changed(path + ".gz", compressed):
+        written.append(name + ".gz")
+    entry["gzip"] = len(compressed)
+
+    if use_brotli:
+        compressed = brotli.compress(raw, quality=11)
+        if _write_bytes_if_changed(path + ".br", compressed):
+            written.append(name + ".br")
+        entry["brotli"] = len(compressed)
+    return entry, written
+
+
+def _files_of(entry, out_dir):
+    path = os.path.join(out_dir, *entry["url"][len(ARTIFACT_URL):].split("/"))
+    return {path} | {path + suffix for suffix, key in ((".gz", "gzip"), (".br", "brotli")) if key in entry}
+
+
+def _remove_stale(out_dir, keep):
+    """Remove earlier artifacts the build no longer produces; any other file is left alone"""
+    removed = 0
+    for directory, _, names in os.walk(out_dir):
+        for name in names:
+            path = os.path.join(directory, name)
+            relative = os.path.relpath(path, out_dir).replace(os.sep, "/")
+            if path not in keep and ARTIFACT_NAME_RE.fullmatch(relative):
+                os.remove(path)
+                removed += 1
+    return removed
+
+
+def _check_out_dir(out_dir):
+    """Refuse to build into a non-empty directory that holds no earlier build"""
+    if not os.path.isdir(out_dir) or not os.listdir(out_dir):
+        return
+    if not os.path.isfile(os.path.join(out_dir, ARTIFACT_MANIFEST_NAME)):
+        raise RuntimeError(f"{out_dir} is not empty and has no {ARTIFACT_MANIFEST_NAME}; choose an empty directory")
+
+
+def build_artifacts(locale_dir=LOCALE_DIR, out_dir=ARTIFACT_DIR, namespaces=False, use_brotli=None):
+    """
+    Build the artifacts for every language and write the manifest.
+    use_brotli defaults to whether the brotli package is installed.
+    Returns the manifest and the number of files written or removed.
+    """
+    if use_brotli is None:
+        use_brotli = brotli is not None
+    elif use_brotli and brotli is None:
+        raise RuntimeError("brotli output needs the 'brotli' package (pip install brotli)")
+    _check_out_dir(out_dir)
+
+    manifest = {"namespaces": namespaces, "languages": {}}
+    keep, changed = set(), 0
+    for lang in discover_languages(locale_dir):
+        data = load_locale(locale_path(lang, locale_dir))
+        if namespaces:
+            entries = {}
+            for namespace, section in split_locale(data).items():
+                entry, written = write_artifact(out_dir, os.path.join(lang, namespace), section, use_brotli)
+                entries[namespace] = entry
+                keep |= _files_of(entry, out_dir)
+                changed += len(written)
+        else:
+            entries, written = write_artifact(out_dir, lang, data, use_brotli)
+            keep |= _files_of(entries, out_dir)
+            changed += len(written)
+        manifest["languages"][lang] = entries
+
+    changed += _remove_stale(out_dir, keep)
+    text = json.dumps(manifest, ensure_ascii=False, indent=2)
+    changed += write_if_changed(os.path.join(out_dir, ARTIFACT_MANIFEST_NAME), text)
+    return manifest, changed
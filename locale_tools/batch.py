@@ -0,0 +1,73 @@
+"""
+Batch mode: sync several site trees in one invocation.
+
+Each target is the root of a site laid out like this repository
+(``src/i18n/locales`` and ``src/i18n/patches``). Roots are independent -
+each has its own lock, journal and manifest - so they are synced in
+parallel, one worker process per root. A root's console output is captured
+and returned with its result, so reports never interleave.
+"""
+
+import io
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+
+from .config import LOCALE_SUBDIR, PATCH_SUBDIR
+from .engine import sync
+
+
+def site_dirs(root):
+    """(locale_dir, patch_dir) of a site tree"""
+    return os.path.join(root, LOCALE_SUBDIR), os.path.join(root, PATCH_SUBDIR)
+
+
+@dataclass
+class SiteResult:
+    """What syncing one site root did"""
+    root: str
+    output: str = ""
+    written: list = field(default_factory=list)
+    unchanged: list = field(default_factory=list)
+    skipped: list = field(default_factory=list)
+    invalid: list = field(default_factory=list)
+    up_to_date: bool = False
+    error: str = None
+
+    @property
+    def failed(self):
+        return bool(self.invalid or self.error)
+
+
+def sync_site(root, options):
+    """Sync one site root, capturing its output; runs in a worker process"""
+    result = SiteResult(root)
+    locale_dir, patch_dir = site_dirs(root)
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        try:
+            if not os.path.isdir(locale_dir):
+                raise FileNotFoundError(f"no locale directory at {locale_dir}")
+            report = sync(locale_dir, patch_dir=patch_dir, **options)
+        except Exception:
+            result.error = traceback.format_exc(limit=1).strip().splitlines()[-1]
+        else:
+            result.written = report.written
+            result.unchanged = report.unchanged
+            result.skipped = report.skipped
+            result.invalid = sorted(report.invalid)
+            result.up_to_date = report.up_to_date
+    result.output = buffer.getvalue()
+    return result
+
+
+def sync_sites(roots, parallel=None, **options):
+    """Sync every root, up to parallel at a time; results keep the order of roots"""
+    roots = [os.path.abspath(root) for root in roots]
+    workers = min(parallel or os.cpu_count() or 1, len(roots))
+    if workers <= 1:
+        return [sync_site(root, options) for root in roots]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(sync_site, roots, [options] * len(roots)))
@@ -0,0 +1,263 @@
+"""
+Benchmark harness for the locale pipeline.
+
+For each (size, languages) scenario a synthetic locale tree is generated in
+a temporary directory, then the same per-locale work sync does (read, parse,
+merge, validate, serialize) plus the disk write is timed and turned into
+throughput per phase. A separate stream mode compares the peak RSS of
+json.load with the streaming reader as the file grows, and a cache mode
+times a parsed-locale cache hit against json.load. Every run is appended
+as one JSON line, tagged with the git commit, so regressions show up when
+runs from different commits are compared.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from .cache import LocaleCache
+from .config import ROOT
+from .engine import PHASES, LocaleTask, locale_path, run_tasks
+from .synthetic import generate_patch, write_tree
+
+RESULTS_PATH = os.path.join(ROOT, "benchmarks", "locale_tools.jsonl")
+
+DEFAULT_SCENARIOS = ((40_000, 8), (40_000, 100), (1_000_000, 8), (10_000_000, 8), (50_000_000, 1))
+
+
+def parse_size(text):
+    """'40K', '1M', '50MB' or a plain byte count"""
+    text = text.strip().upper().rstrip("B")
+    units = {"K": 1_000, "M": 1_000_000, "G": 1_000_000_000}
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def git_commit(root=ROOT):
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scenario(size, languages, jobs=1, policy="patch-wins", seed=0):
+    """Benchmark one synthetic tree and return its per-phase results"""
+    with tempfile.TemporaryDirectory(prefix="locale-bench-") as tmp:
+        codes, base = write_tree(tmp, languages, size, seed)
+        ops = generate_patch(base, seed=seed)
+        del base
+        tasks = [LocaleTask(code, locale_path(code, tmp), ops, policy) for code in codes]
+        file_bytes = os.path.getsize(locale_path(codes[0], tmp)) * len(codes)
+
+        start = time.perf_counter()
+        results = run_tasks(tasks, jobs)
+        wall = time.perf_counter() - start
+
+        write_start = time.perf_counter()
+        for result in results:
+            with open(locale_path(result.lang, tmp), "w", encoding="utf-8") as f:
+                f.write(result.text)
+        write = time.perf_counter() - write_start
+
+    phases = {phase: sum(result.timings[phase] for result in results) for phase in PHASES}
+    phases["write"] = write
+    return {
+        "size": size,
+        "languages": languages,
+        "bytes": file_bytes,
+        "patchOps": len(ops),
+        "jobs": jobs,
+        "policy": policy,
+        "wall": wall + write,
+        "phases": {
+            phase: {"seconds": seconds, "mbPerSecond": file_bytes / seconds / 1e6 if seconds else None}
+            for phase, seconds in phases.items()
+        },
+    }
+
+
+def run_benchmarks(scenarios=DEFAULT_SCENARIOS, jobs=1, policy="patch-wins"):
+    results = []
+    for size, languages in scenarios:
+        result = run_scenario(size, languages, jobs, policy)
+        results.append(result)
+        throughput = ", ".join(
+            f"{phase} {stats['mbPerSecond']:.0f} MB/s" for phase, stats in result["phases"].items() if stats["mbPerSecond"]
+        )
+        print(f"✓ {size / 1e6:g} MB x {languages} languages: {result['wall']:.2f}s ({throughput})")
+
+    return {
+        "kind": "pipeline",
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "scenarios": results,
+    }
+
+
+STREAM_SIZES = (1_000_000, 10_000_000, 50_000_000)
+
+
+def peak_rss():
+    """
+    Peak resident set size of this process in bytes. VmHWM is read where
+    available because ru_maxrss is inherited from the parent across fork/exec.
+    """
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    scale = 1 if platform.system() == "Darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _peak_rss(mode, path, queue):
+    """Child process body: walk path with json.load or the streaming reader, report peak RSS"""
+    from .stream import iter_events
+
+    baseline = peak_rss()
+    start = time.perf_counter()
+    if mode == "json.load":
+        with open(path, "r", encoding="utf-8") as f:
+            json.load(f)
+    else:
+        for _ in iter_events(path):
+            pass
+    seconds = time.perf_counter() - start
+    queue.put((peak_rss(), baseline, seconds))
+
+
+def run_stream_benchmark(sizes=STREAM_SIZES, seed=0):
+    """Peak RSS of json.load against the streaming reader, each in a fresh process"""
+    import multiprocessing
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    with tempfile.TemporaryDirectory(prefix="locale-bench-") as tmp:
+        for size in sizes:
+            codes, _ = write_tree(tmp, 1, size, seed)
+            path = locale_path(codes[0], tmp)
+            row = {"size": size, "bytes": os.path.getsize(path)}
+            for mode in ("json.load", "stream"):
+                queue = context.Queue()
+                process = context.Process(target=_peak_rss, args=(mode, path, queue))
+                process.start()
+                peak, baseline, seconds = queue.get()
+                process.join()
+                row[mode] = {"peakRss": peak, "overBaseline": peak - baseline, "seconds": seconds}
+            results.append(row)
+            print(
+                f"✓ {row['bytes'] / 1e6:6.1f} MB: json.load +{row['json.load']['overBaseline'] / 1e6:7.1f} MB RSS "
+                f"({row['json.load']['seconds']:.2f}s), stream +{row['stream']['overBaseline'] / 1e6:5.1f} MB RSS "
+                f"({row['stream']['seconds']:.2f}s)"
+            )
+
+    return {
+        "kind": "stream-rss",
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "python": platform.python_version(),
+        "scenarios": results,
+    }
+
+
+CACHE_SIZES = (40_000, 1_000_000, 5_000_000)
+
+
+def _best(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run_cache_benchmark(sizes=CACHE_SIZES, repeat=7, seed=0):
+    """Best-of-repeat seconds to load one locale with json.load, a cache miss and a cache hit"""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="locale-bench-") as tmp:
+        for size in sizes:
+            codes, _ = write_tree(os.path.join(tmp, str(size)), 1, size, seed)
+            path = locale_path(codes[0], os.path.join(tmp, str(size)))
+
+            def load_json():
+                with open(path, "r", encoding="utf-8") as f:
+                    json.load(f)
+
+            cache = LocaleCache(os.path.join(tmp, f"cache-{size}"))
+
+            def miss():
+                cache.clear()
+                cache.load(path)
+
+            row = {
+                "size": size,
+                "bytes": os.path.getsize(path),
+                "json.load": _best(load_json, repeat),
+                "miss": _best(miss, repeat),
+                "hit": _best(lambda: cache.load(path), repeat),
+            }
+            results.append(row)
+            print(
+                f"✓ {row['bytes'] / 1e6:6.2f} MB: json.load {row['json.load'] * 1000:7.2f} ms, "
+                f"cache miss {row['miss'] * 1000:7.2f} ms, hit {row['hit'] * 1000:7.2f} ms "
+                f"({row['json.load'] / row['hit']:.2f}x)"
+            )
+
+    return {
+        "kind": "cache",
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "python": platform.python_version(),
+        "scenarios": results,
+    }
+
+
+def load_history(path=RESULTS_PATH, kind="pipeline"):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            runs = [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+    return [run for run in runs if run.get("kind", "pipeline") == kind]
+
+
+def append_result(run, path=RESULTS_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(run, sort_keys=True) + "\n")
+
+
+def compare(run, previous):
+    """Per-scenario, per-phase ratio of this run's seconds to a previous run's"""
+    def key(scenario):
+        return scenario["size"], scenario["languages"], scenario["jobs"], scenario["policy"]
+
+    before = {key(scenario): scenario for scenario in previous["scenarios"]}
+    ratios = {}
+    for scenario in run["scenarios"]:
+        old = before.get(key(scenario))
+        if not old:
+            continue
+        ratios[key(scenario)] = {
+            phase: stats["seconds"] / old["phases"][phase]["seconds"]
+            for phase, stats in scenario["phases"].items()
+            if old["phases"].get(phase, {}).get("seconds")
+        }
+    return ratios
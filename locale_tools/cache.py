@@ -0,0 +1,159 @@
+"""
+Parsed-locale cache.
+
+Parsed locale trees are stored as marshal blobs under .cache/locale_tools,
+stamped with a format version and the Python version (marshal is not stable
+across Python releases) and keyed by the locale's path. An entry is used
+straight away when the file's size and mtime match what it recorded, so a
+hit costs one stat and one unmarshal and never reads or hashes the file.
+Only when the stat differs is the file hashed: an unchanged hash refreshes
+the entry in place, anything else is parsed from JSON again. Corrupt, stale
+or unreadable entries fall back to a normal JSON parse.
+
+Each blob starts with a small header naming its source file, so entries
+whose locale no longer exists can be pruned without unmarshalling the trees.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import struct
+import sys
+
+from .config import CACHE_DIR
+
+CACHE_VERSION = (2,) + tuple(sys.version_info[:2])
+
+# Byte length of the marshalled header that precedes each tree
+HEADER_LENGTH = struct.Struct("<I")
+
+# Set LOCALE_TOOLS_NO_CACHE=1 (or pass --no-cache) to always parse from JSON
+_enabled = not os.environ.get("LOCALE_TOOLS_NO_CACHE")
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def default_cache():
+    """The shared cache, or None when caching is disabled"""
+    return LocaleCache(CACHE_DIR) if _enabled else None
+
+
+class LocaleCache:
+    """marshal-backed cache of parsed locale trees"""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, path):
+        key = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{os.path.basename(path)}-{key}.marshal")
+
+    def _read_header(self, f):
+        try:
+            (length,) = HEADER_LENGTH.unpack(f.read(HEADER_LENGTH.size))
+            version, source, size, mtime, digest = marshal.loads(f.read(length))
+        except (OSError, EOFError, ValueError, TypeError, struct.error):
+            return None
+        if version != CACHE_VERSION:
+            return None
+        return source, size, mtime, digest
+
+    def _read_entry(self, path, stat=None):
+        """
+        (size, mtime, digest, tree) of an entry; with stat, the tree is only
+        unmarshalled when the entry matches it, and is None otherwise
+        """
+        try:
+            with open(self.entry_path(path), "rb") as f:
+                header = self._read_header(f)
+                if header is None:
+                    return None
+                _, size, mtime, digest = header
+                fresh = stat is None or (size, mtime) == (stat.st_size, stat.st_mtime_ns)
+                # marshal.loads on the whole blob is several times faster than marshal.load(f)
+                return size, mtime, digest, marshal.loads(f.read()) if fresh else None
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    def _write_entry(self, path, stat, digest, data):
+        header = (CACHE_VERSION, os.path.abspath(path), stat.st_size, stat.st_mtime_ns, digest)
+        target = self.entry_path(path)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            header = marshal.dumps(header)
+            with open(tmp, "wb") as f:
+                f.write(HEADER_LENGTH.pack(len(header)) + header)
+                f.write(marshal.dumps(data))
+            os.replace(tmp, target)
+        except (OSError, ValueError):
+            # A cache that cannot be written is just a cache miss next time
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def parse(self, path, raw, stat=None):
+        """Return the parsed tree for raw (the file's bytes or text), from the cache if valid"""
+        stat = stat or os.stat(path)
+        entry = self._read_entry(path, stat)
+        if entry is not None and entry[3] is not None:
+            self.hits += 1
+            return entry[3]
+
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry is not None and entry[2] == digest:
+            # Touched but not changed: refresh the stat, keep the tree
+            entry = self._read_entry(path)
+            if entry is not None:
+                self._write_entry(path, stat, digest, entry[3])
+                self.hits += 1
+                return entry[3]
+
+        self.misses += 1
+        data = json.loads(raw)
+        self._write_entry(path, stat, digest, data)
+        return data
+
+    def load(self, path):
+        stat = os.stat(path)
+        entry = self._read_entry(path, stat)
+        if entry is not None and entry[3] is not None:
+            self.hits += 1
+            return entry[3]
+        with open(path, "rb") as f:
+            return self.parse(path, f.read(), os.fstat(f.fileno()))
+
+    def prune(self):
+        """Remove entries whose locale file no longer exists, or that are unreadable; returns how many"""
+        removed = 0
+        if not os.path.isdir(self.cache_dir):
+            return removed
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".marshal"):
+                continue
+            entry = os.path.join(self.cache_dir, name)
+            try:
+                with open(entry, "rb") as f:
+                    header = self._read_header(f)
+            except OSError:
+                continue
+            if header is None or not os.path.exists(header[0]):
+                os.remove(entry)
+                removed += 1
+        return removed
+
+    def clear(self):
+        removed = 0
+        if os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".marshal"):
+                    os.remove(os.path.join(self.cache_dir, name))
+                    removed += 1
+        return removed
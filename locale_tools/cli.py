@@ -0,0 +1,597 @@
+"""Command line entry point: python -m locale_tools <command>"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from .artifacts import build_artifacts
+from .batch import site_dirs, sync_sites
+from .bench import (
+    DEFAULT_SCENARIOS,
+    CACHE_SIZES,
+    RESULTS_PATH,
+    STREAM_SIZES,
+    append_result,
+    compare,
+    load_history,
+    parse_size,
+    run_benchmarks,
+    run_cache_benchmark,
+    run_stream_benchmark,
+)
+from . import cache
+from .cache import LocaleCache
+from .config import ARTIFACT_SUBDIR, DIST_SUBDIR, NAMESPACE_SUBDIR, SITE_ROOT, STORE_SUBPATH, VERCEL_CONFIG_NAME
+from .coverage import SOURCE_LANGUAGE, coverage_report, write_report
+from .diff import summarize
+from .engine import discover_languages, load_locale, locale_path, mark_applied, mark_current, sync
+from .journal import is_applied, load_journal, upgrade_journal
+from .keyindex import KeyIndex
+from .merge import POLICIES
+from .patches import discover_patch_sets
+from .prerender import prerender, update_vercel_config
+from .placeholders import compare_placeholders, describe, extract_from_events, extract_placeholders
+from .profiling import Profiler
+from .scan import scan_usage
+from .split import split_all
+from .staleness import load_sources, stale_keys, string_hashes
+from . import store
+from .stream import iter_events, stream_lookup
+from .translate import PROVIDERS, fill_missing, make_provider
+from .watch import watch
+
+
+def cmd_sync(args):
+    if args.target:
+        cmd_sync_sites(args)
+        return
+
+    profiler = Profiler(memory=args.profile_memory).start()
+    try:
+        report = sync(args.locale_dir, languages=args.lang, patch_dir=args.patch_dir, force=args.force, jobs=args.jobs,
+                      use_journal=not args.ignore_journal, policy=None if args.replace else args.policy,
+                      profiler=profiler, strict_placeholders=args.strict_placeholders,
+                      dry_run=args.dry_run, deny_removals=args.deny_removals)
+    finally:
+        profiler.stop()
+    if args.profile:
+        profiler.write(args.profile, args.folded)
+        print(f"✓ Wrote phase profile to {args.profile}" + (f" and {args.folded}" if args.folded else ""))
+    if report.up_to_date:
+        print("✓ Patch sources and locale files match the manifest, nothing to do")
+        return
+    if args.dry_run:
+        print_patches(report, args.patch_out)
+        if report.invalid:
+            sys.exit(1)
+        return
+    if report.applied:
+        print(f"✓ Applied patch sets: {', '.join(report.applied)}")
+    elif not report.invalid:
+        print("✓ Every patch set is already in the journal")
+
+    print(
+        f"\n✓ Synced in a single pass: {len(report.written)} written, "
+        f"{len(report.unchanged)} unchanged, {len(report.skipped)} skipped"
+    )
+    if args.jobs > 1 and report.phases:
+        print_phases(report)
+    if report.stale:
+        total = sum(len(paths) for paths in report.stale.values())
+        print(f"⚠ {total} translations are older than their source string (python -m locale_tools stale)")
+    if report.invalid:
+        sys.exit(1)
+
+
+def print_patches(report, out=None):
+    patches = {f"{lang}.json": patch for lang, patch in report.patches.items()}
+    if out:
+        write_report(patches, out)
+        if out == "-":
+            return
+    for name, patch in patches.items():
+        counts = ", ".join(f"{n} {op}" for op, n in summarize(patch).items())
+        print(f"  {name}: {counts}")
+        if not out:
+            for op in patch:
+                value = f" {json.dumps(op['value'], ensure_ascii=False)}" if "value" in op else ""
+                print(f"    {op['op']:<7} {op['path']}{value}")
+    print(f"\n✓ Dry run: {len(patches)} locale files would change, nothing was written")
+
+
+def cmd_sync_sites(args):
+    if args.profile or args.dry_run:
+        sys.exit("✗ --profile and --dry-run cannot be combined with --target")
+    results = sync_sites(args.target, args.parallel, languages=args.lang, force=args.force, jobs=args.jobs,
+                         use_journal=not args.ignore_journal, policy=None if args.replace else args.policy,
+                         strict_placeholders=args.strict_placeholders, deny_removals=args.deny_removals)
+    for result in results:
+        print(f"\n== {result.root}")
+        if result.output:
+            print(result.output.rstrip())
+        if result.error:
+            print(f"✗ {result.error}")
+        elif result.up_to_date:
+            print("✓ Up to date")
+        else:
+            print(
+                f"✓ {len(result.written)} written, {len(result.unchanged)} unchanged, "
+                f"{len(result.skipped)} skipped"
+            )
+
+    failed = [result.root for result in results if result.failed]
+    print(f"\n✓ Synced {len(results) - len(failed)} of {len(results)} site roots")
+    if failed:
+        print(f"✗ Failed: {', '.join(failed)}")
+        sys.exit(1)
+
+
+def print_phases(report):
+    print(f"\nPhase timings with {report.jobs} jobs:")
+    work_total = 0.0
+    for phase, stats in report.phases.items():
+        work_total += stats["work"]
+        print(
+            f"  {phase:<10} {stats['work'] * 1000:8.1f} ms work  "
+            f"{stats['critical'] * 1000:8.1f} ms busiest worker  {stats['speedup']:.2f}x"
+        )
+    speedup = work_total / report.wall if report.wall else 1.0
+    print(f"  {'total':<10} {work_total * 1000:8.1f} ms work  {report.wall * 1000:8.1f} ms wall  {speedup:.2f}x")
+
+
+def cmd_journal(args):
+    if args.mark_applied is not None:
+        marked = mark_applied(args.locale_dir, args.patch_dir, args.mark_applied or None)
+        print(f"✓ Marked as applied: {', '.join(marked) or 'nothing'}")
+        return
+
+    journal = load_journal(args.locale_dir)
+    patch_sets = discover_patch_sets(args.patch_dir, args.locale_dir)
+    upgrade_journal(journal, patch_sets)
+    pending = {}
+    for patch_set in patch_sets:
+        langs = [lang for lang in patch_set.ops if not is_applied(journal, patch_set, lang)]
+        if langs:
+            pending[patch_set.name] = langs
+
+    for name, entry in journal["applied"].items():
+        print(f"  applied  {name} ({entry['source']}) {', '.join(entry['languages'])} at {entry['appliedAt']}")
+    for name, langs in pending.items():
+        print(f"  pending  {name} {', '.join(langs)}")
+
+
+def cmd_stale(args):
+    if args.baseline or args.mark_current is not None:
+        marked = mark_current(args.locale_dir, args.lang, args.mark_current or None, args.source,
+                              untracked_only=args.baseline)
+        print(f"✓ Recorded {sum(marked.values())} translations as current: "
+              + ", ".join(f"{lang} {n}" for lang, n in marked.items() if n))
+        return
+
+    hashes = string_hashes(load_locale(locale_path(args.source, args.locale_dir)))
+    stale = stale_keys(load_sources(args.locale_dir, args.source), hashes, args.lang)
+    if args.json:
+        write_report({"source": args.source, "stale": stale}, args.json)
+        if args.json == "-":
+            return
+
+    for lang, paths in stale.items():
+        print(f"  {lang}: {len(paths)} stale")
+        for path in paths:
+            print(f"    {path}")
+    total = sum(len(paths) for paths in stale.values())
+    print(f"\n{total} translations are older than their {args.source}.json string")
+    if total and args.check:
+        sys.exit(1)
+
+
+def cmd_translate(args):
+    try:
+        provider = make_provider(args.provider)
+    except (ValueError, ImportError, AttributeError) as e:
+        sys.exit(f"✗ {e}")
+    summary = fill_missing(provider, args.locale_dir, args.patch_dir, args.lang, args.source, args.jobs)
+    for lang, (strings, calls) in summary.items():
+        print(f"  {lang}: {strings} strings, {calls} {provider.name} requests")
+    print(f"\n✓ {sum(calls for _, calls in summary.values())} requests; run sync to merge machine_translations")
+
+
+def cmd_watch(args):
+    out_dir = args.out if args.split else None
+    watch(args.locale_dir, args.patch_dir, out_dir, polling=args.poll, policy=args.policy)
+
+
+def cmd_cache(args):
+    cache = LocaleCache()
+    if args.clear:
+        print(f"✓ Removed {cache.clear()} cached locales from {cache.cache_dir}")
+        return
+
+    pruned = cache.prune()
+    for lang in discover_languages(args.locale_dir):
+        cache.load(locale_path(lang, args.locale_dir))
+    print(f"✓ Warmed cache in {cache.cache_dir}: {cache.hits} valid, {cache.misses} parsed, {pruned} pruned")
+
+
+def cmd_placeholders(args):
+    languages = args.lang or discover_languages(args.locale_dir)
+    found = {}
+    for lang in set(languages) | {args.source}:
+        path = locale_path(lang, args.locale_dir)
+        found[lang] = extract_from_events(iter_events(path)) if args.stream else extract_placeholders(load_locale(path))
+
+    report = {
+        "source": args.source,
+        "languages": {
+            lang: compare_placeholders(found[args.source], found[lang]) for lang in languages if lang != args.source
+        },
+    }
+    if args.json:
+        write_report(report, args.json)
+        if args.json == "-":
+            return
+
+    total = 0
+    for lang, mismatches in report["languages"].items():
+        total += len(mismatches)
+        for path, mismatch in mismatches.items():
+            print(f"  ✗ {lang}: {describe(path, mismatch)}")
+    print(f"\n{total} placeholder mismatches against {args.source}.json")
+    if total:
+        sys.exit(1)
+
+
+def cmd_get(args):
+    for lang in args.lang or discover_languages(args.locale_dir):
+        try:
+            value = stream_lookup(locale_path(lang, args.locale_dir), args.key)
+        except KeyError:
+            print(f"  {lang}: ✗ missing")
+            continue
+        print(f"  {lang}: {json.dumps(value, ensure_ascii=False)}")
+
+
+def cmd_keys(args):
+    index = KeyIndex.build(args.locale_dir)
+    try:
+        index.mask(args.lang)
+        found = index.query(args.pattern)
+    except ValueError as e:
+        sys.exit(f"✗ {e}")
+    # Keys are matched in every language; --lang only narrows where they are reported missing
+    targets = args.lang or index.languages
+    incomplete = 0
+    for path, langs in found.items():
+        missing = [lang for lang in targets if lang not in langs]
+        incomplete += bool(missing)
+        print(f"  {path}" + (f"  (missing in {', '.join(missing)})" if missing else ""))
+    print(f"\n{len(found)} keys match {args.pattern}, {incomplete} missing in {', '.join(targets)}")
+
+
+def cmd_split(args):
+    manifest, written = split_all(args.locale_dir, args.out, args.lang)
+    public, admin = 0, 0
+    for entries in manifest["languages"].values():
+        for namespace, entry in entries.items():
+            if namespace in manifest["adminNamespaces"]:
+                admin += entry["bytes"]
+            else:
+                public += entry["bytes"]
+
+    print(f"\n✓ Wrote {written} files to {args.out}")
+    print(f"  public namespaces: {public / 1024:.1f} KB, admin namespaces: {admin / 1024:.1f} KB (all languages)")
+
+
+def cmd_build(args):
+    try:
+        manifest, changed = build_artifacts(args.locale_dir, args.artifact_dir, args.namespaces, args.brotli)
+    except RuntimeError as e:
+        sys.exit(f"✗ {e}")
+    raw, gz, br = 0, 0, 0
+    for entries in manifest["languages"].values():
+        for entry in entries.values() if args.namespaces else [entries]:
+            raw += entry["bytes"]
+            gz += entry["gzip"]
+            br += entry.get("brotli", 0)
+
+    print(f"✓ Built {len(manifest['languages'])} languages into {args.artifact_dir} ({changed} files changed)")
+    sizes = f"  {raw / 1024:.1f} KB minified, {gz / 1024:.1f} KB gzip"
+    print(sizes + (f", {br / 1024:.1f} KB brotli" if br else ""))
+
+
+def cmd_prerender(args):
+    try:
+        written = prerender(args.locale_dir, args.template, args.seo_dir, args.fragments, args.source)
+    except FileNotFoundError as e:
+        sys.exit(f"✗ {e.filename} not found; run the Vite build first or pass --fragments")
+    kind = "head fragments" if args.fragments else "pages"
+    print(f"✓ Prerendered SEO {kind}: {written} files written")
+
+    config = os.path.join(args.root, VERCEL_CONFIG_NAME)
+    if not os.path.exists(config):
+        return
+    if update_vercel_config(config, args.locale_dir, write=args.update_vercel):
+        if args.update_vercel:
+            print(f"✓ Updated the prerender rewrites in {VERCEL_CONFIG_NAME}")
+        else:
+            print(f"⚠ {VERCEL_CONFIG_NAME} rewrites do not match the routes and languages; run prerender --update-vercel")
+
+
+def cmd_store(args):
+    conn = store.connect(args.db)
+    try:
+        if args.action == "import":
+            counts = store.import_locales(conn, args.locale_dir, args.lang)
+            print(f"✓ Imported {sum(counts.values())} strings in {len(counts)} languages into {args.db}")
+            if args.patches:
+                patch_sets = discover_patch_sets(args.patch_dir, args.locale_dir)
+                journal = load_journal(args.locale_dir)
+                upgrade_journal(journal, patch_sets)
+                counts = store.import_patch_sets(conn, patch_sets, args.lang, journal)
+                print(f"✓ Merged {sum(counts.values())} pending patch strings into {', '.join(counts) or 'no languages'}")
+        elif args.action == "export":
+            try:
+                written = store.export_locales(conn, args.locale_dir, args.lang, patch_dir=args.patch_dir)
+            except store.StoreConflict as e:
+                sys.exit(f"✗ {e}")
+            print(f"✓ Exported {', '.join(written) or 'nothing'}; other languages unchanged")
+        elif args.action == "get":
+            for lang in args.lang or store.stored_languages(conn):
+                try:
+                    value = store.lookup(conn, lang, args.key)
+                except KeyError:
+                    print(f"  {lang}: ✗ missing")
+                    continue
+                print(f"  {lang}: {json.dumps(value, ensure_ascii=False)}")
+        elif args.action == "set":
+            store.set_value(conn, args.lang_code, args.key, json.loads(args.value) if args.json else args.value)
+            print(f"✓ Set {args.lang_code}:{args.key}")
+    finally:
+        conn.close()
+
+
+def cmd_coverage(args):
+    report = coverage_report(args.locale_dir, args.source, args.lang, stream=args.stream)
+    if args.json:
+        write_report(report, args.json)
+        if args.json == "-":
+            return
+
+    print(f"Coverage against {report['source']}.json ({report['sourceLeaves']} keys):")
+    for lang, result in report["languages"].items():
+        sections = ", ".join(result["missingSections"][:6])
+        if len(result["missingSections"]) > 6:
+            sections += ", ..."
+        print(
+            f"  {lang}: {result['coverage'] * 100:5.1f}%  {len(result['missing'])} missing, "
+            f"{len(result['extra'])} extra, {len(result['mismatched'])} mismatched"
+            + (f"  [{sections}]" if sections else "")
+        )
+
+
+def cmd_scan(args):
+    start = time.perf_counter()
+    report = scan_usage(args.src_dir, args.locale_dir, args.source)
+    elapsed = time.perf_counter() - start
+    if args.json:
+        write_report(report, args.json)
+        if args.json == "-":
+            return
+
+    print(f"Scanned {report['files']} files in {elapsed * 1000:.0f} ms: {report['used']} of {report['keys']} keys used")
+    for key, langs in report["unused"].items():
+        print(f"  unused     {key} ({', '.join(langs)})")
+    for key, entry in report["undefined"].items():
+        fallback = ", has inline default" if entry["hasDefault"] else ""
+        print(f"  ✗ undefined  {key} ({', '.join(entry['files'])}{fallback})")
+    print(f"\n{len(report['unused'])} unused, {len(report['undefined'])} undefined")
+
+
+def cmd_bench(args):
+    if args.stream:
+        sizes = [parse_size(size) for size in args.sizes.split(",")] if args.sizes else STREAM_SIZES
+        run = run_stream_benchmark(sizes)
+        append_result(run, args.results)
+        print(f"\n✓ Appended results for commit {run['commit']} to {args.results}")
+        return
+    if args.cache:
+        sizes = [parse_size(size) for size in args.sizes.split(",")] if args.sizes else CACHE_SIZES
+        run = run_cache_benchmark(sizes)
+        append_result(run, args.results)
+        print(f"\n✓ Appended results for commit {run['commit']} to {args.results}")
+        return
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")] if args.sizes else None
+    counts = [int(count) for count in args.languages.split(",")] if args.languages else None
+    if sizes or counts:
+        scenarios = [(size, count) for size in sizes or [40_000] for count in counts or [8]]
+    else:
+        scenarios = DEFAULT_SCENARIOS
+
+    previous = load_history(args.results)
+    run = run_benchmarks(scenarios, args.jobs, args.policy)
+    append_result(run, args.results)
+    print(f"\n✓ Appended results for commit {run['commit']} to {args.results}")
+
+    if previous:
+        for (size, count, _, _), ratios in compare(run, previous[-1]).items():
+            changes = ", ".join(f"{phase} {ratio:.2f}x" for phase, ratio in ratios.items())
+            print(f"  vs {previous[-1]['commit']}: {size / 1e6:g} MB x {count}: {changes}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m locale_tools")
+    parser.add_argument("--root", default=SITE_ROOT,
+                        help="site tree to work on (default: $LOCALE_TOOLS_ROOT or this repository)")
+    parser.add_argument("--locale-dir", help="locale directory (default: <root>/src/i18n/locales)")
+    parser.add_argument("--patch-dir", help="patch set directory (default: <root>/src/i18n/patches)")
+    parser.add_argument("--no-cache", action="store_true", help="parse every locale from JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("sync", help="apply every patch set to the locale files")
+    p.add_argument("--lang", action="append", help="only sync this language (repeatable)")
+    p.add_argument("--force", action="store_true", help="ignore the manifest and re-merge every locale")
+    p.add_argument("--policy", choices=POLICIES, default="patch-wins",
+                   help="how to resolve keys where the patch and the file disagree (default: patch-wins)")
+    p.add_argument("--replace", action="store_true",
+                   help="replace whole sections instead of deep-merging, like the old scripts")
+    p.add_argument("--strict-placeholders", action="store_true",
+                   help="refuse to write locales whose {{placeholders}} differ from the source language")
+    p.add_argument("--ignore-journal", action="store_true",
+                   help="re-run patch sets the journal has already recorded")
+    p.add_argument("--profile", metavar="PATH", help="write per-phase, per-locale timings as JSON")
+    p.add_argument("--profile-memory", action="store_true", help="also trace peak memory per phase (slower)")
+    p.add_argument("--folded", metavar="PATH", help="with --profile, also write flamegraph folded stacks")
+    p.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                   help=f"merge locales in a pool of N processes (this machine has {os.cpu_count()} CPUs)")
+    p.add_argument("--dry-run", action="store_true",
+                   help="write nothing; print the JSON Patch (RFC 6902) each locale would receive")
+    p.add_argument("--patch-out", metavar="PATH", help="with --dry-run, write the patches as JSON ('-' for stdout)")
+    p.add_argument("--deny-removals", action="store_true", help="refuse to write locales that would lose a key")
+    p.add_argument("--target", action="append", metavar="ROOT",
+                   help="sync this site root instead of --root (repeatable); roots are synced in parallel")
+    p.add_argument("--parallel", type=int, metavar="N", help="with --target, sync at most N roots at once")
+    p.set_defaults(func=cmd_sync)
+
+    p = commands.add_parser("journal", help="show applied and pending patch sets")
+    p.add_argument("--mark-applied", nargs="*", metavar="NAME",
+                   help="record patch sets (all if none given) as applied without running them")
+    p.set_defaults(func=cmd_journal)
+
+    p = commands.add_parser("stale", help="list translations whose source string changed since they were made")
+    p.add_argument("--source", default=SOURCE_LANGUAGE)
+    p.add_argument("--lang", action="append", help="only this language (repeatable)")
+    p.add_argument("--json", metavar="PATH", help="write the report as JSON ('-' for stdout)")
+    p.add_argument("--check", action="store_true", help="exit with status 1 when anything is stale")
+    p.add_argument("--mark-current", nargs="*", metavar="KEY",
+                   help="record these keys (every stale key if none given) as translated from the current source")
+    p.add_argument("--baseline", action="store_true",
+                   help="record every translation without a record yet as current")
+    p.set_defaults(func=cmd_stale)
+
+    p = commands.add_parser("translate", help="machine-translate missing keys into the machine_translations patch set")
+    p.add_argument("--provider", default="stub",
+                   help=f"provider name ({', '.join(PROVIDERS)}) or module:Class (default: stub)")
+    p.add_argument("--source", default=SOURCE_LANGUAGE)
+    p.add_argument("--lang", action="append", help="only translate into this language (repeatable)")
+    p.add_argument("--jobs", "-j", type=int, default=4, metavar="N", help="concurrent provider requests (default: 4)")
+    p.set_defaults(func=cmd_translate)
+
+    p = commands.add_parser("watch", help="re-apply only the affected patches whenever a source changes")
+    p.add_argument("--split", action="store_true", help="also keep the namespace chunks up to date")
+    p.add_argument("--out", help="namespace chunk directory (default: <root>/public/locales)")
+    p.add_argument("--poll", action="store_true", help="poll for changes instead of using inotify")
+    p.add_argument("--policy", choices=POLICIES, default="patch-wins")
+    p.set_defaults(func=cmd_watch)
+
+    p = commands.add_parser("cache", help="warm, prune or clear the parsed-locale cache")
+    p.add_argument("--clear", action="store_true", help="remove every cached locale")
+    p.set_defaults(func=cmd_cache)
+
+    p = commands.add_parser("placeholders", help="check {{placeholders}} in every language against the source")
+    p.add_argument("--source", default=SOURCE_LANGUAGE)
+    p.add_argument("--lang", action="append", help="only check this language (repeatable)")
+    p.add_argument("--json", metavar="PATH", help="write the full report as JSON ('-' for stdout)")
+    p.add_argument("--stream", action="store_true", help="read locales with the bounded-memory reader")
+    p.set_defaults(func=cmd_placeholders)
+
+    p = commands.add_parser("get", help="look up one key in every language without loading the locales")
+    p.add_argument("key", help="dot path, e.g. seo.home.title")
+    p.add_argument("--lang", action="append", help="only look in this language (repeatable)")
+    p.set_defaults(func=cmd_get)
+
+    p = commands.add_parser("keys", help="list the keys matching a pattern in every language, e.g. seo.* or proposal.**")
+    p.add_argument("pattern", help="dot path where * matches one segment and a trailing ** everything below")
+    p.add_argument("--lang", action="append", help="only report missing keys for this language (repeatable)")
+    p.set_defaults(func=cmd_keys)
+
+    p = commands.add_parser("split", help="write per-language, per-namespace chunks for lazy loading")
+    p.add_argument("--out", help="output directory (default: <root>/public/locales)")
+    p.add_argument("--lang", action="append", help="only split this language (repeatable)")
+    p.set_defaults(func=cmd_split)
+
+    p = commands.add_parser("build", help="write content-hashed, precompressed locale artifacts and their manifest")
+    p.add_argument("--out", dest="artifact_dir", help="artifact directory (default: <root>/public/i18n)")
+    p.add_argument("--namespaces", action="store_true", help="one artifact per namespace instead of per language")
+    p.add_argument("--brotli", action=argparse.BooleanOptionalAction, default=None,
+                   help="also write .br files (default: when the brotli package is installed)")
+    p.set_defaults(func=cmd_build)
+
+    p = commands.add_parser("prerender", help="write per-language, per-route pages with the SEO tags in <head>")
+    p.add_argument("--template", help="built page to fill in (default: <root>/dist/index.html)")
+    p.add_argument("--out", dest="seo_dir", help="output directory (default: <root>/dist/seo)")
+    p.add_argument("--fragments", action="store_true", help="only write the <head> fragments, no template needed")
+    p.add_argument("--source", default=SOURCE_LANGUAGE, help="language missing SEO strings fall back to")
+    p.add_argument("--update-vercel", action="store_true",
+                   help=f"regenerate the page rewrites in <root>/{VERCEL_CONFIG_NAME} from the routes and languages")
+    p.set_defaults(func=cmd_prerender)
+
+    p = commands.add_parser("store", help="SQLite translation store: bulk import/export, lookups and updates")
+    p.add_argument("--db", help="store path (default: <root>/src/i18n/translations.sqlite3)")
+    p.set_defaults(func=cmd_store)
+    actions = p.add_subparsers(dest="action", required=True)
+    a = actions.add_parser("import", help="load the JSON locales into the store")
+    a.add_argument("--lang", action="append", help="only import this language (repeatable)")
+    a.add_argument("--patches", action="store_true", help="also merge the patch set payloads the journal has not applied")
+    a = actions.add_parser("export", help="write the stored languages back to <lang>.json")
+    a.add_argument("--lang", action="append", help="only export this language (repeatable)")
+    a = actions.add_parser("get", help="look up a key, or a whole section, in every language")
+    a.add_argument("key", help="dot path, e.g. vr.features.zeroLatencyDesc")
+    a.add_argument("--lang", action="append", help="only look in this language (repeatable)")
+    a = actions.add_parser("set", help="assign one key without rewriting anything else")
+    a.add_argument("lang_code", metavar="lang")
+    a.add_argument("key")
+    a.add_argument("value")
+    a.add_argument("--json", action="store_true", help="parse the value as JSON, e.g. a section or list")
+
+    p = commands.add_parser("coverage", help="report missing, extra and mismatched keys per language")
+    p.add_argument("--source", default=SOURCE_LANGUAGE, help="language the others are compared with")
+    p.add_argument("--lang", action="append", help="only report this language (repeatable)")
+    p.add_argument("--json", metavar="PATH", help="write the full report as JSON ('-' for stdout)")
+    p.add_argument("--stream", action="store_true", help="flatten locales with the bounded-memory reader")
+    p.set_defaults(func=cmd_coverage)
+
+    p = commands.add_parser("scan", help="find unused and undefined keys in the React sources")
+    p.add_argument("--src-dir", help="React sources (default: <root>/src)")
+    p.add_argument("--source", default=SOURCE_LANGUAGE, help="language t() keys are checked against")
+    p.add_argument("--json", metavar="PATH", help="write the full report as JSON ('-' for stdout)")
+    p.set_defaults(func=cmd_scan)
+
+    p = commands.add_parser("bench", help="benchmark the pipeline on synthetic locale trees")
+    p.add_argument("--sizes", help="comma-separated locale sizes, e.g. 40K,1M,50M")
+    p.add_argument("--languages", help="comma-separated language counts, e.g. 8,100")
+    p.add_argument("--jobs", "-j", type=int, default=1, metavar="N")
+    p.add_argument("--policy", choices=POLICIES, default="patch-wins")
+    p.add_argument("--stream", action="store_true", help="compare peak RSS of json.load and the streaming reader")
+    p.add_argument("--cache", action="store_true", help="time a parsed-locale cache hit against json.load")
+    p.add_argument("--results", default=RESULTS_PATH, help="JSON lines file runs are appended to")
+    p.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    locale_dir, patch_dir = site_dirs(args.root)
+    args.locale_dir = args.locale_dir or locale_dir
+    args.patch_dir = args.patch_dir or patch_dir
+    if "out" in args and args.out is None:
+        args.out = os.path.join(args.root, NAMESPACE_SUBDIR)
+    if "artifact_dir" in args and args.artifact_dir is None:
+        args.artifact_dir = os.path.join(args.root, ARTIFACT_SUBDIR)
+    if "db" in args and args.db is None:
+        args.db = os.path.join(args.root, STORE_SUBPATH)
+    if "seo_dir" in args:
+        args.template = args.template or os.path.join(args.root, DIST_SUBDIR, "index.html")
+        args.seo_dir = args.seo_dir or os.path.join(args.root, DIST_SUBDIR, "seo")
+    if "src_dir" in args and args.src_dir is None:
+        args.src_dir = os.path.join(args.root, "src")
+    if args.no_cache:
+        cache.disable()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
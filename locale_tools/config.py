@@ -0,0 +1,62 @@
+"""Shared paths and constants for the locale toolchain."""
+
+import os
+
+# Repository root (the directory that holds package.json)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Site whose locales are processed by default; override with LOCALE_TOOLS_ROOT or --root
+SITE_ROOT = os.path.abspath(os.environ.get("LOCALE_TOOLS_ROOT") or ROOT)
+
+# Layout of a site tree, relative to its root
+LOCALE_SUBDIR = os.path.join("src", "i18n", "locales")
+PATCH_SUBDIR = os.path.join("src", "i18n", "patches")
+NAMESPACE_SUBDIR = os.path.join("public", "locales")
+
+# React sources that use the translation keys
+SRC_DIR = os.path.join(SITE_ROOT, "src")
+
+# Base directory for locale files
+LOCALE_DIR = os.path.join(SITE_ROOT, LOCALE_SUBDIR)
+
+# Parsed-locale cache
+CACHE_DIR = os.path.join(ROOT, ".cache", "locale_tools")
+
+# Language every other locale is checked against
+SOURCE_LANGUAGE = "en"
+
+# Patch sets, in the order they are applied
+PATCH_SET_NAMES = ("missing_keys", "translations", "seo_translations")
+
+# Patch set payloads: <PATCH_DIR>/<patch set>/<lang>.json
+PATCH_DIR = os.path.join(SITE_ROOT, PATCH_SUBDIR)
+
+# Namespace chunks for lazy loading, served by Vite from public/
+NAMESPACE_DIR = os.path.join(SITE_ROOT, NAMESPACE_SUBDIR)
+
+# Hashed, precompressed locale artifacts, served from /i18n/
+ARTIFACT_SUBDIR = os.path.join("public", "i18n")
+ARTIFACT_DIR = os.path.join(SITE_ROOT, ARTIFACT_SUBDIR)
+
+# SQLite translation store
+STORE_SUBPATH = os.path.join("src", "i18n", "translations.sqlite3")
+STORE_PATH = os.path.join(SITE_ROOT, STORE_SUBPATH)
+
+# Vite build output, where prerendered pages are written
+DIST_SUBDIR = "dist"
+DIST_DIR = os.path.join(SITE_ROOT, DIST_SUBDIR)
+
+# Deployment config holding the prerendered-page rewrites
+VERCEL_CONFIG_NAME = "vercel.json"
+
+# Top-level sections only the admin panel needs
+ADMIN_NAMESPACES = ("admin", "proposal", "invoice")
+
+
+def site_root(locale_dir):
+    """Root of the site tree a locale directory belongs to"""
+    locale_dir = os.path.abspath(locale_dir)
+    suffix = os.sep + LOCALE_SUBDIR
+    if locale_dir.endswith(suffix):
+        return locale_dir[: -len(suffix)]
+    return os.path.dirname(locale_dir)
@@ -0,0 +1,110 @@
+"""
+Missing-key coverage across locales.
+
+Every locale is indexed once in the shared key trie and read back as a
+``{dot.path: kind}`` map covering both sections and leaves. Missing, extra
+and type-mismatched keys per language are then plain set operations against
+the source language. Very large locales can be flattened from the streaming
+reader instead of a parsed tree.
+"""
+
+import json
+
+from .config import LOCALE_DIR, SOURCE_LANGUAGE
+from .engine import discover_languages, locale_path
+from .keyindex import KeyIndex
+from .stream import iter_events
+
+KINDS = {
+    dict: "object",
+    list: "array",
+    str: "string",
+    bool: "boolean",
+    int: "number",
+    float: "number",
+    type(None): "null",
+}
+
+
+def flatten(data):
+    """Return {dot.path: kind} for every section and leaf in a locale tree"""
+    flat = {}
+    stack = [("", data)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            path = f"{prefix}.{key}" if prefix else key
+            kind = KINDS.get(type(value), type(value).__name__)
+            flat[path] = kind
+            if kind == "object":
+                stack.append((path, value))
+    return flat
+
+
+def stream_flatten(path):
+    """Same map as flatten, built from streamed events without loading the tree"""
+    flat = {}
+    for key_path, value in iter_events(path, containers=True):
+        if any(isinstance(key, int) for key in key_path):
+            continue
+        flat[".".join(key_path)] = KINDS.get(type(value), type(value).__name__)
+    return flat
+
+
+def _leaves(flat, paths):
+    return sorted(path for path in paths if flat[path] != "object")
+
+
+def _roots(paths):
+    """Collapse a set of paths to the ones whose parent is not in the set"""
+    return sorted(path for path in paths if path.rpartition(".")[0] not in paths)
+
+
+def compare(source, target):
+    """Coverage of one flattened locale against the flattened source"""
+    missing = source.keys() - target.keys()
+    extra = target.keys() - source.keys()
+    mismatched = {path for path in source.keys() & target.keys() if source[path] != target[path]}
+
+    source_leaves = sum(1 for kind in source.values() if kind != "object")
+    missing_leaves = _leaves(source, missing)
+    return {
+        "leaves": sum(1 for kind in target.values() if kind != "object"),
+        "coverage": round(1 - len(missing_leaves) / source_leaves, 4) if source_leaves else 1.0,
+        "missing": missing_leaves,
+        "missingSections": _roots(missing),
+        "extra": _leaves(target, extra),
+        "mismatched": {path: {"expected": source[path], "found": target[path]} for path in sorted(mismatched)},
+    }
+
+
+def coverage_report(locale_dir=LOCALE_DIR, source_lang=SOURCE_LANGUAGE, languages=None, stream=False):
+    """
+    Build the machine-readable coverage report for every language from one
+    shared key index. With stream, locales are flattened from streamed
+    events instead, so memory is bounded by the key sets rather than the
+    full trees.
+    """
+    languages = languages or discover_languages(locale_dir)
+    targets = sorted(set(languages) | {source_lang})
+    if stream:
+        flat = {lang: stream_flatten(locale_path(lang, locale_dir)) for lang in targets}
+    else:
+        index = KeyIndex.build(locale_dir, targets)
+        flat = {lang: index.flat(lang) for lang in targets}
+    source = flat[source_lang]
+
+    return {
+        "source": source_lang,
+        "sourceLeaves": sum(1 for kind in source.values() if kind != "object"),
+        "languages": {lang: compare(source, flat[lang]) for lang in languages if lang != source_lang},
+    }
+
+
+def write_report(report, path):
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if path == "-":
+        print(text)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
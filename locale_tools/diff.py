@@ -0,0 +1,49 @@
+"""
+Structural diff of locales as RFC 6902 JSON Patch.
+
+The diff walks both trees once, side by side, so its cost is linear in the
+size of the locales and its output in the size of the change. Key order is
+not part of the diff, as JSON Patch cannot express it. Lists of strings are
+compared item by item when their lengths match and replaced whole otherwise.
+"""
+
+
+def escape(key):
+    """Escape one key as a JSON Pointer (RFC 6901) reference token"""
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def pointer(path):
+    return "".join(f"/{escape(str(key))}" for key in path)
+
+
+def diff(old, new, path=()):
+    """JSON Patch operations that turn old into new"""
+    ops = []
+    _diff(old, new, path, ops)
+    return ops
+
+
+def _diff(old, new, path, ops):
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in old.items():
+            if key not in new:
+                ops.append({"op": "remove", "path": pointer(path + (key,))})
+            else:
+                _diff(value, new[key], path + (key,), ops)
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": pointer(path + (key,)), "value": value})
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for index, (before, after) in enumerate(zip(old, new)):
+            _diff(before, after, path + (index,), ops)
+    elif old != new:
+        ops.append({"op": "replace", "path": pointer(path), "value": new})
+
+
+def summarize(ops):
+    """{op: count} for a patch"""
+    counts = {}
+    for op in ops:
+        counts[op["op"]] = counts.get(op["op"], 0) + 1
+    return counts
@@ -0,0 +1,531 @@
+"""
+Single-pass locale patch engine.
+
+Every locale that any patch set targets is loaded once, all patches are
+applied in memory in patch set order, and the result is written once.
+Files whose merged output is byte-identical to what is on disk are never
+rewritten, and a run whose inputs match the manifest parses no locale at all.
+Outputs are committed together under the locale directory's lock.
+"""
+
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from .cache import LocaleCache, default_cache
+from .config import LOCALE_DIR, PATCH_DIR, SOURCE_LANGUAGE, site_root
+from .diff import diff
+from .journal import is_applied, load_journal, record, save_journal, upgrade_journal
+from .manifest import (
+    content_hash,
+    file_hash,
+    load_manifest,
+    ops_hash,
+    save_manifest,
+    sources_hash,
+)
+from .merge import MergeConflict, MergeStats, leaf_paths, merge_at
+from .patches import discover_patch_sets, patch_sources
+from .placeholders import compare_placeholders, describe, extract_placeholders
+from .profiling import Profiler
+from .staleness import (
+    baseline,
+    load_sources,
+    record_translations,
+    save_sources,
+    stale_keys,
+    string_hashes,
+)
+from .transaction import Transaction, interrupted, locked, recover
+
+# Base locale files are named after their language code, e.g. en.json or pt-BR.json
+LOCALE_FILE_RE = re.compile(r"^([a-z]{2,3}(?:-[A-Z]{2})?)\.json$")
+
+
+def locale_path(lang, locale_dir=LOCALE_DIR):
+    return os.path.join(locale_dir, f"{lang}.json")
+
+
+def load_locale(path):
+    """Parse a locale, through the parsed-locale cache unless it is disabled"""
+    cache = default_cache()
+    if cache is not None:
+        return cache.load(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dump_locale(data):
+    """
+    Canonical serialization of a locale, matching how the files in
+    src/i18n/locales are stored: key order preserved, 2-space indent,
+    non-ASCII kept as-is and no trailing newline.
+    """
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def dump_compact(data):
+    """Minified serialization for files shipped to the browser"""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_if_changed(path, text):
+    """Write text unless the file already holds exactly that; returns True if written"""
+    if file_hash(path) == content_hash(text):
+        return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+
+def discover_languages(locale_dir=LOCALE_DIR):
+    """Language codes of the base locale files, ignoring fragments and backups"""
+    languages = []
+    for name in sorted(os.listdir(locale_dir)):
+        match = LOCALE_FILE_RE.match(name)
+        if match:
+            languages.append(match.group(1))
+    return languages
+
+
+def set_path(data, path, value):
+    """Assign value at a key path, creating intermediate sections"""
+    node = data
+    for key in path[:-1]:
+        node = node.setdefault(key, {})
+    node[path[-1]] = value
+
+
+def group_by_language(patch_sets, languages=None, journal=None):
+    """
+    Collect every patch set's operations per language, keeping their order.
+    With a journal, patch sets already applied to a language are left out.
+    """
+    grouped = {}
+    for patch_set in patch_sets:
+        for lang in patch_set.ops:
+            if languages and lang not in languages:
+                continue
+            if journal is not None and is_applied(journal, patch_set, lang):
+                continue
+            grouped.setdefault(lang, []).extend(patch_set.ops[lang])
+    return grouped
+
+
+def apply_ops(data, ops, policy=None):
+    """
+    Apply (path, value) operations to a locale. With a merge policy each value
+    is deep-merged into the existing section and the MergeStats are returned;
+    with policy None the section is replaced wholesale, as the old scripts did.
+    """
+    if policy is None:
+        for path, value in ops:
+            set_path(data, path, value)
+        return None
+
+    stats = MergeStats()
+    for path, value in ops:
+        merge_at(data, path, value, policy, stats)
+    return stats
+
+
+def validate_locale(data, path=()):
+    """Return a list of problems: every leaf must be a string or a list of strings"""
+    problems = []
+    for key, value in data.items():
+        here = path + (key,)
+        if not key:
+            problems.append(f"{'.'.join(path) or '<root>'}: empty key")
+        if isinstance(value, dict):
+            problems.extend(validate_locale(value, here))
+        elif isinstance(value, list):
+            if not all(isinstance(item, str) for item in value):
+                problems.append(f"{'.'.join(here)}: list with non-string items")
+        elif not isinstance(value, str):
+            problems.append(f"{'.'.join(here)}: {type(value).__name__} value")
+    return problems
+
+
+# Per-locale phases run by merge_locale, in order
+PHASES = ("read", "parse", "merge", "validate", "serialize", "diff")
+
+
+@dataclass
+class LocaleTask:
+    """Everything a worker needs to merge one locale"""
+    lang: str
+    path: str
+    ops: list
+    policy: str = "patch-wins"
+    memory: bool = False
+    cache_dir: str = None
+    diff: bool = False
+    source: bool = False
+
+
+@dataclass
+class LocaleResult:
+    """Output of merge_locale for one language"""
+    lang: str
+    original: str
+    text: str
+    problems: list
+    records: list
+    worker: int
+    merge: dict = None
+    placeholders: dict = None
+    patch: list = None
+    updated: list = None
+    hashes: dict = None
+
+    @property
+    def timings(self):
+        timings = dict.fromkeys(PHASES, 0.0)
+        for record in self.records:
+            timings[record["phase"]] += record["seconds"]
+        return timings
+
+
+def merge_locale(task):
+    """
+    Read, parse, merge, validate and serialize one locale; runs in a worker
+    process. With task.diff, also return the JSON Patch from the original.
+    """
+    lang, path = task.lang, task.path
+    profiler = Profiler(task.memory).start()
+    cache = LocaleCache(task.cache_dir) if task.cache_dir else None
+    stats = None
+    try:
+        with profiler.phase("read", lang):
+            with open(path, "r", encoding="utf-8") as f:
+                original = f.read()
+        with profiler.phase("parse", lang):
+            data = cache.parse(path, original) if cache else json.loads(original)
+            before = json.loads(original) if task.diff else None
+
+        try:
+            with profiler.phase("merge", lang):
+                stats = apply_ops(data, task.ops, task.policy)
+        except MergeConflict as e:
+            return LocaleResult(lang, original, original, [str(e)], profiler.records, os.getpid())
+
+        with profiler.phase("validate", lang):
+            problems = validate_locale(data)
+            placeholders = extract_placeholders(data)
+            hashes = string_hashes(data) if task.source else None
+        with profiler.phase("serialize", lang):
+            text = dump_locale(data)
+        if task.diff:
+            with profiler.phase("diff", lang):
+                patch = diff(before, data)
+    finally:
+        profiler.stop()
+
+    merge = stats.counts() if stats else None
+    result = LocaleResult(lang, original, text, problems, profiler.records, os.getpid(), merge, placeholders)
+    if task.diff:
+        result.patch = patch
+    if stats:
+        result.updated = stats.added + stats.overwritten
+    else:
+        result.updated = [leaf for path, value in task.ops for leaf in leaf_paths(value, tuple(path))]
+    result.hashes = hashes
+    return result
+
+
+def run_tasks(tasks, jobs=1):
+    """Run merge_locale over tasks, in a process pool when jobs > 1; keeps task order"""
+    if jobs <= 1 or len(tasks) <= 1:
+        return [merge_locale(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        return list(pool.map(merge_locale, tasks))
+
+
+def phase_summary(results):
+    """
+    Per-phase totals for a set of results: the summed work across all locales,
+    the busiest worker's share of it and the resulting speedup.
+    """
+    summary = {}
+    for phase in PHASES:
+        per_worker = {}
+        for result in results:
+            per_worker[result.worker] = per_worker.get(result.worker, 0.0) + result.timings[phase]
+        work = sum(per_worker.values())
+        critical = max(per_worker.values(), default=0.0)
+        summary[phase] = {
+            "work": work,
+            "critical": critical,
+            "speedup": work / critical if critical else 1.0,
+        }
+    return summary
+
+
+@dataclass
+class SyncReport:
+    """What a sync run did to each language"""
+    written: list = field(default_factory=list)
+    unchanged: list = field(default_factory=list)
+    skipped: list = field(default_factory=list)
+    invalid: dict = field(default_factory=dict)
+    placeholders: dict = field(default_factory=dict)
+    phases: dict = field(default_factory=dict)
+    wall: float = 0.0
+    jobs: int = 1
+    profiler: Profiler = None
+    applied: list = field(default_factory=list)
+    merges: dict = field(default_factory=dict)
+    patches: dict = field(default_factory=dict)
+    stale: dict = field(default_factory=dict)
+    up_to_date: bool = False
+
+
+def _merge_summary(counts):
+    if not counts:
+        return ""
+    return f" ({', '.join(f'{n} {what}' for what, n in counts.items() if n)})"
+
+
+def _outputs_match(manifest, locale_dir, languages):
+    """True when every recorded locale file still has its recorded hash"""
+    locales = manifest["locales"]
+    if not locales:
+        return False
+    for lang, entry in locales.items():
+        if languages and lang not in languages:
+            continue
+        if file_hash(locale_path(lang, locale_dir)) != entry["output"]:
+            return False
+    return True
+
+
+def check_placeholders(results, locale_dir=LOCALE_DIR, source_lang=SOURCE_LANGUAGE, strict=False):
+    """
+    Compare the placeholders the workers extracted from each merged locale
+    with the source language's. The source is only read from disk when it was
+    not part of this run. With strict, mismatches become validation problems.
+    """
+    if not results:
+        return {}
+    by_lang = {result.lang: result.placeholders for result in results if result.placeholders is not None}
+    source = by_lang.get(source_lang)
+    if source is None:
+        path = locale_path(source_lang, locale_dir)
+        if not os.path.exists(path):
+            return {}
+        source = extract_placeholders(load_locale(path))
+
+    mismatches = {}
+    for result in results:
+        if result.lang == source_lang or result.placeholders is None:
+            continue
+        found = compare_placeholders(source, result.placeholders)
+        if not found:
+            continue
+        mismatches[result.lang] = found
+        details = [describe(path, mismatch) for path, mismatch in found.items()]
+        if strict:
+            result.problems.extend(details)
+        else:
+            print(f"⚠ {result.lang}.json: {len(found)} placeholder mismatches against {source_lang}.json")
+            for detail in details:
+                print(f"    {detail}")
+    return mismatches
+
+
+def source_hashes(results, locale_dir=LOCALE_DIR, source_lang=SOURCE_LANGUAGE):
+    """String hashes of the source locale, as merged in this run or else from disk"""
+    for result in results:
+        if result.hashes is not None:
+            return result.hashes
+    path = locale_path(source_lang, locale_dir)
+    return string_hashes(load_locale(path)) if os.path.exists(path) else {}
+
+
+def sync(locale_dir=LOCALE_DIR, patch_sets=None, languages=None, patch_dir=PATCH_DIR, force=False, jobs=1,
+         use_journal=True, policy="patch-wins", profiler=None, source_lang=SOURCE_LANGUAGE,
+         strict_placeholders=False, dry_run=False, deny_removals=False):
+    """
+    Apply every pending patch set to every targeted locale in one load/write
+    pass. Patch sets the journal has already recorded are skipped unless
+    use_journal is False. Patches are deep-merged using the given conflict
+    policy; policy None replaces whole sections instead.
+
+    Pass a Profiler to collect per-phase timings (and memory, if enabled).
+    Placeholders in every merged locale are checked against source_lang;
+    mismatches are warnings unless strict_placeholders is set. Translations
+    a patch adds or overwrites are recorded against the current source
+    strings, and report.stale lists those whose source string has changed.
+
+    The run holds the locale directory's lock and writes every output in one
+    transaction: if any locale fails validation, nothing is written.
+
+    With dry_run, nothing is written, not even the completion of an
+    interrupted commit, and report.patches holds the JSON Patch
+    each changed locale would receive. With deny_removals, a locale whose
+    merge would remove a key fails validation.
+    """
+    profiler = profiler or Profiler()
+    report = SyncReport(jobs=jobs, profiler=profiler)
+
+    with locked(locale_dir):
+        if dry_run:
+            if interrupted(locale_dir):
+                print("⚠ An interrupted write is pending; the next sync completes it before merging")
+        else:
+            for path in recover(locale_dir):
+                print(f"✓ Completed interrupted write of {os.path.basename(path)}")
+        manifest = load_manifest(locale_dir)
+        sources = None
+
+        with profiler.phase("discovery"):
+            if patch_sets is None:
+                sources = sources_hash(patch_sources(patch_dir, locale_dir), site_root(locale_dir))
+                if not force and manifest["sources"] == sources and _outputs_match(manifest, locale_dir, languages):
+                    report.up_to_date = True
+                    return report
+                patch_sets = discover_patch_sets(patch_dir, locale_dir)
+
+            journal = load_journal(locale_dir)
+            upgrade_journal(journal, patch_sets)
+            grouped = group_by_language(patch_sets, languages, journal if use_journal else None)
+        cache = default_cache()
+        tasks = []
+        inputs = {}
+        for lang, ops in grouped.items():
+            path = locale_path(lang, locale_dir)
+            inputs[lang] = content_hash(f"{policy}:{ops_hash(ops)}")
+            entry = manifest["locales"].get(lang, {})
+
+            if not force and entry.get("input") == inputs[lang] and file_hash(path) == entry.get("output"):
+                report.skipped.append(lang)
+                continue
+            tasks.append(LocaleTask(lang, path, ops, policy, profiler.memory, cache and cache.cache_dir,
+                                    dry_run or deny_removals, lang == source_lang))
+
+        start = time.perf_counter()
+        results = run_tasks(tasks, jobs)
+        report.wall = time.perf_counter() - start
+        report.phases = phase_summary(results)
+        for result in results:
+            profiler.extend(result.records)
+        report.placeholders = check_placeholders(results, locale_dir, source_lang, strict_placeholders)
+        for result in results:
+            if result.patch:
+                report.patches[result.lang] = result.patch
+            if deny_removals and result.patch:
+                result.problems.extend(f"would remove {op['path']}" for op in result.patch if op["op"] == "remove")
+
+        for result in results:
+            if result.problems:
+                report.invalid[result.lang] = result.problems
+                print(f"✗ {result.lang}.json:")
+                for problem in result.problems:
+                    print(f"    {problem}")
+        if report.invalid:
+            print("✗ Aborted: no locale files were written")
+            return report
+        if dry_run:
+            return report
+
+        translated = None
+        if results:
+            translated = load_sources(locale_dir, source_lang)
+            hashes = source_hashes(results, locale_dir, source_lang)
+            for result in results:
+                if result.lang != source_lang:
+                    record_translations(translated, result.lang, result.updated, hashes)
+            report.stale = stale_keys(translated, hashes, languages)
+
+        txn = Transaction(locale_dir)
+        try:
+            for result in results:
+                if result.text == result.original:
+                    report.unchanged.append(result.lang)
+                else:
+                    with profiler.phase("write", result.lang):
+                        txn.stage(locale_path(result.lang, locale_dir), result.text)
+                    report.written.append(result.lang)
+                if result.merge:
+                    report.merges[result.lang] = result.merge
+                manifest["locales"][result.lang] = {"input": inputs[result.lang], "output": content_hash(result.text)}
+            # Locales this run did not merge keep their input hash but record their
+            # current output, so a hand edit does not disable the fast path for good
+            merged = {result.lang for result in results}
+            for lang in languages or discover_languages(locale_dir):
+                if lang not in merged:
+                    manifest["locales"].setdefault(lang, {})["output"] = file_hash(locale_path(lang, locale_dir))
+
+            for patch_set in patch_sets:
+                targeted = [
+                    lang for lang in patch_set.ops
+                    if lang in grouped and not (use_journal and is_applied(journal, patch_set, lang))
+                ]
+                if targeted:
+                    record(journal, patch_set, targeted)
+                    report.applied.append(patch_set.name)
+            if sources is not None and not languages:
+                manifest["sources"] = sources
+            save_journal(locale_dir, journal, txn)
+            if translated is not None:
+                save_sources(locale_dir, translated, txn)
+            save_manifest(locale_dir, manifest, txn)
+
+            with profiler.phase("commit"):
+                txn.commit()
+        except BaseException:
+            txn.abort()
+            raise
+
+    for result in results:
+        if result.lang in report.written:
+            print(f"✓ Updated {result.lang}.json{_merge_summary(result.merge)}")
+    return report
+
+
+def mark_applied(locale_dir=LOCALE_DIR, patch_dir=PATCH_DIR, names=None):
+    """Record patch sets as applied without running them, e.g. to baseline a tree"""
+    with locked(locale_dir):
+        journal = load_journal(locale_dir)
+        patch_sets = discover_patch_sets(patch_dir, locale_dir)
+        upgrade_journal(journal, patch_sets)
+        marked = []
+        for patch_set in patch_sets:
+            if names and patch_set.name not in names:
+                continue
+            record(journal, patch_set, list(patch_set.ops))
+            marked.append(patch_set.name)
+        txn = Transaction(locale_dir)
+        save_journal(locale_dir, journal, txn)
+        txn.commit()
+    return marked
+
+
+def mark_current(locale_dir=LOCALE_DIR, languages=None, keys=None, source_lang=SOURCE_LANGUAGE, untracked_only=False):
+    """
+    Record translations as made from the current source strings, e.g. after a
+    review: the given keys, or every stale key when none are given. With
+    untracked_only, only keys that have no record yet are baselined instead.
+    Returns {lang: number of keys recorded}.
+    """
+    with locked(locale_dir):
+        translated = load_sources(locale_dir, source_lang)
+        hashes = string_hashes(load_locale(locale_path(source_lang, locale_dir)))
+        targets = [lang for lang in languages or discover_languages(locale_dir) if lang != source_lang]
+        stale = stale_keys(translated, hashes, targets)
+        marked = {}
+        for lang in targets:
+            if untracked_only:
+                marked[lang] = baseline(translated, lang, load_locale(locale_path(lang, locale_dir)), hashes)
+                continue
+            paths = keys or stale.get(lang, [])
+            record_translations(translated, lang, paths, hashes)
+            marked[lang] = sum(1 for path in paths if path in hashes)
+        txn = Transaction(locale_dir)
+        save_sources(locale_dir, translated, txn)
+        txn.commit()
+    return marked
@@ -0,0 +1,94 @@
+"""
+Patch journal.
+
+Like a migrations table, the journal next to the locales records which patch
+sets have been applied to which language, together with the content hash of
+the payload file that was applied. A patch set is only executed for a
+language when it is new or its payload changed, so re-running the sync never
+replays old patches over later hand edits, and checking an applied payload
+only hashes its bytes instead of parsing it.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+
+from .manifest import content_hash, file_hash, ops_hash
+
+JOURNAL_NAME = ".locale-journal.json"
+JOURNAL_VERSION = 2
+
+# Version 1 recorded the hash of the parsed operations rather than of the file
+LEGACY_VERSIONS = (1,)
+
+
+def journal_path(locale_dir):
+    return os.path.join(locale_dir, JOURNAL_NAME)
+
+
+def load_journal(locale_dir):
+    try:
+        with open(journal_path(locale_dir), "r", encoding="utf-8") as f:
+            journal = json.load(f)
+    except FileNotFoundError:
+        return {"version": JOURNAL_VERSION, "applied": {}}
+
+    if journal.get("version") not in (JOURNAL_VERSION, *LEGACY_VERSIONS):
+        raise ValueError(f"{journal_path(locale_dir)}: unsupported journal version {journal.get('version')}")
+    return journal
+
+
+def save_journal(locale_dir, journal, txn=None):
+    """Write the journal if it changed, staged in txn when one is given"""
+    text = json.dumps(journal, ensure_ascii=False, indent=2, sort_keys=True)
+    path = journal_path(locale_dir)
+    if file_hash(path) == content_hash(text):
+        return
+    if txn is not None:
+        txn.stage(path, text)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def upgrade_journal(journal, patch_sets):
+    """
+    Convert a version 1 journal in place: entries whose recorded operations
+    still match the current payload are re-keyed on the payload's file hash,
+    the rest are dropped so they run again. Entries of patch sets that no
+    longer exist are kept as they are. Each payload is parsed once here and
+    never again on later runs.
+    """
+    if journal["version"] == JOURNAL_VERSION:
+        return
+    by_name = {patch_set.name: patch_set for patch_set in patch_sets}
+    for name, entry in journal["applied"].items():
+        patch_set = by_name.get(name)
+        if patch_set is None:
+            continue
+        entry["languages"] = {
+            lang: patch_set.digest(lang)
+            for lang, recorded in entry["languages"].items()
+            if lang in patch_set.ops and ops_hash(patch_set.ops[lang]) == recorded
+        }
+    journal["version"] = JOURNAL_VERSION
+
+
+def is_applied(journal, patch_set, lang):
+    """True when this exact payload of the patch set was applied to lang"""
+    entry = journal["applied"].get(patch_set.name)
+    return entry is not None and entry["languages"].get(lang) == patch_set.digest(lang)
+
+
+def record(journal, patch_set, languages):
+    """Mark a patch set as applied to the given languages"""
+    for lang in languages:
+        record_payload(journal, patch_set.name, patch_set.source, lang, patch_set.digest(lang))
+
+
+def record_payload(journal, name, source, lang, digest):
+    """Mark one language's payload of a patch set, by its hash, as applied"""
+    entry = journal["applied"].setdefault(name, {"source": source, "languages": {}})
+    entry["source"] = source
+    entry["appliedAt"] = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    entry["languages"][lang] = digest
@@ -0,0 +1,167 @@
+"""
+Key-path trie over every locale.
+
+All languages share one trie of dot-path segments. Each node records, as
+bitmasks over the indexed languages, where its path exists and where it is
+a section, so a key that appears in eight locales is one node rather than
+eight dict entries, and every segment string is interned once. Nodes use
+``__slots__`` and leaf nodes carry no children dict, which keeps the index
+well below the size of the parsed trees it was built from.
+
+Prefix queries walk only the matching part of the trie:
+
+* ``seo`` - the path itself
+* ``seo.*`` - its direct children
+* ``proposal.**`` - everything underneath it
+* ``seo.*.title`` - ``*`` matches any one segment anywhere in the pattern
+"""
+
+import sys
+
+from .config import LOCALE_DIR
+from .engine import discover_languages, load_locale, locale_path
+
+
+class KeyNode:
+    """One path segment; kinds only holds leaves that are not strings"""
+
+    __slots__ = ("children", "present", "sections", "kinds")
+
+    def __init__(self):
+        self.children = None
+        self.present = 0
+        self.sections = 0
+        self.kinds = None
+
+    def child(self, key):
+        if self.children is None:
+            self.children = {}
+        node = self.children.get(key)
+        if node is None:
+            node = self.children[sys.intern(key)] = KeyNode()
+        return node
+
+
+def _kind(value):
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    return "number" if isinstance(value, (int, float)) else type(value).__name__
+
+
+class KeyIndex:
+    """Trie of every key path in a set of locales"""
+
+    def __init__(self):
+        self.languages = []
+        self.bits = {}
+        self.root = KeyNode()
+
+    @classmethod
+    def build(cls, locale_dir=LOCALE_DIR, languages=None):
+        index = cls()
+        for lang in languages or discover_languages(locale_dir):
+            index.add(lang, load_locale(locale_path(lang, locale_dir)))
+        return index
+
+    def add(self, lang, data):
+        """Index one parsed locale"""
+        if lang in self.bits:
+            raise ValueError(f"{lang} is already indexed")
+        bit = 1 << len(self.languages)
+        self.bits[lang] = bit
+        self.languages.append(lang)
+
+        stack = [(self.root, data)]
+        while stack:
+            parent, section = stack.pop()
+            for key, value in section.items():
+                node = parent.child(key)
+                node.present |= bit
+                if isinstance(value, dict):
+                    node.sections |= bit
+                    stack.append((node, value))
+                elif not isinstance(value, str):
+                    if node.kinds is None:
+                        node.kinds = {}
+                    node.kinds[bit] = _kind(value)
+
+    def mask(self, languages=None):
+        """Bitmask of the given languages (all by default); ValueError for one that is not indexed"""
+        mask = 0
+        for lang in languages or self.languages:
+            if lang not in self.bits:
+                raise ValueError(f"{lang} is not indexed")
+            mask |= self.bits[lang]
+        return mask
+
+    def languages_of(self, mask):
+        return [lang for lang in self.languages if mask & self.bits[lang]]
+
+    def kind(self, node, lang):
+        """Kind of a path in one language, like coverage.KINDS; None if it is absent"""
+        bit = self.bits[lang]
+        if not node.present & bit:
+            return None
+        if node.sections & bit:
+            return "object"
+        return node.kinds.get(bit, "string") if node.kinds else "string"
+
+    def _walk(self, node, prefix):
+        """(path, node) of every node under node, depth first"""
+        stack = [(prefix, node)]
+        while stack:
+            prefix, node = stack.pop()
+            if node.children:
+                for key, child in node.children.items():
+                    path = f"{prefix}.{key}" if prefix else key
+                    yield path, child
+                    stack.append((path, child))
+
+    def _match(self, node, prefix, segments):
+        if not segments:
+            yield prefix, node
+            return
+        segment, rest = segments[0], segments[1:]
+        if segment == "**":
+            for path, child in self._walk(node, prefix):
+                yield path, child
+            return
+        if not node.children:
+            return
+        keys = node.children if segment == "*" else [segment] if segment in node.children else []
+        for key in keys:
+            yield from self._match(node.children[key], f"{prefix}.{key}" if prefix else key, rest)
+
+    def query(self, pattern, languages=None):
+        """{path: languages that have it} for every path matching pattern, sorted by path"""
+        segments = pattern.split(".")
+        if "**" in segments[:-1]:
+            raise ValueError(f"{pattern}: ** is only allowed as the last segment")
+        mask = self.mask(languages)
+        found = {}
+        for path, node in self._match(self.root, "", segments):
+            if node.present & mask:
+                found[path] = self.languages_of(node.present & mask)
+        return dict(sorted(found.items()))
+
+    def flat(self, lang):
+        """{dot path: kind} for one language, the same map as coverage.flatten"""
+        bit = self.bits[lang]
+        return {path: self.kind(node, lang) for path, node in self._walk(self.root, "") if node.present & bit}
+
+    def leaves(self):
+        """{dot path: languages where it is a leaf} over every indexed language"""
+        return {
+            path: self.languages_of(node.present & ~node.sections)
+            for path, node in self._walk(self.root, "")
+            if node.present & ~node.sections
+        }
+
+    def __len__(self):
+        return sum(1 for _ in self._walk(self.root, ""))
@@ -0,0 +1,86 @@
+"""
+Content-hash manifest for incremental syncs.
+
+The manifest lives next to the locales and records the hash of the patch
+sources, and for every language the hash of the patch operations applied to
+it and of the file that was produced. A run whose inputs and outputs all
+still match the manifest has nothing to do.
+"""
+
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = ".locale-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def content_hash(data):
+    """sha256 of text or bytes"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    """sha256 of a file's bytes, or None when it does not exist"""
+    try:
+        with open(path, "rb") as f:
+            return content_hash(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def sources_hash(paths, root):
+    """
+    Combined hash of a set of source files, independent of their order and
+    of where the tree is checked out: paths are hashed relative to root
+    """
+    relative = {os.path.relpath(path, root).replace(os.sep, "/"): path for path in paths}
+    digest = hashlib.sha256()
+    for name in sorted(relative):
+        digest.update(name.encode("utf-8"))
+        digest.update((file_hash(relative[name]) or "").encode("ascii"))
+    return digest.hexdigest()
+
+
+def ops_hash(ops):
+    """Hash of a language's patch operations in canonical JSON form"""
+    canonical = json.dumps(
+        [[list(path), value] for path, value in ops],
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return content_hash(canonical)
+
+
+def manifest_path(locale_dir):
+    return os.path.join(locale_dir, MANIFEST_NAME)
+
+
+def load_manifest(locale_dir):
+    """Read the manifest, returning an empty one if it is missing or outdated"""
+    empty = {"version": MANIFEST_VERSION, "sources": None, "locales": {}}
+    try:
+        with open(manifest_path(locale_dir), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return empty
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return empty
+    return manifest
+
+
+def save_manifest(locale_dir, manifest, txn=None):
+    """Write the manifest if it changed, staged in txn when one is given"""
+    text = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True)
+    path = manifest_path(locale_dir)
+    if file_hash(path) == content_hash(text):
+        return
+    if txn is not None:
+        txn.stage(path, text)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
@@ -0,0 +1,103 @@
+"""
+Recursive deep merge of a patch into a locale tree.
+
+Both trees are walked once. Keys only in the patch are added, keys only in
+the file are preserved, and leaves present on both sides with different
+values are conflicts, resolved by the policy:
+
+* ``patch-wins`` - the patch value overwrites the file value
+* ``file-wins``  - the file value is kept
+* ``fail``       - a MergeConflict is raised
+"""
+
+import copy
+from dataclasses import dataclass, field
+
+POLICIES = ("patch-wins", "file-wins", "fail")
+
+
+class MergeConflict(ValueError):
+    """Raised by the fail policy when the patch and the file disagree"""
+
+
+@dataclass
+class MergeStats:
+    """Dot paths of the leaves a merge added, overwrote, kept or left alone"""
+    added: list = field(default_factory=list)
+    overwritten: list = field(default_factory=list)
+    kept: list = field(default_factory=list)
+    preserved: list = field(default_factory=list)
+
+    def counts(self):
+        return {
+            "added": len(self.added),
+            "overwritten": len(self.overwritten),
+            "kept": len(self.kept),
+            "preserved": len(self.preserved),
+        }
+
+
+def leaf_paths(value, path):
+    """Dot paths of every leaf under value (value itself if it is a leaf)"""
+    if not isinstance(value, dict):
+        return [".".join(path)]
+    paths = []
+    for key, child in value.items():
+        paths.extend(leaf_paths(child, path + (key,)))
+    return paths
+
+
+def _merge_key(target, key, value, policy, path, stats):
+    """Merge one patch entry into target[key]"""
+    if key not in target:
+        target[key] = copy.deepcopy(value)
+        stats.added.extend(leaf_paths(value, path))
+        return
+
+    current = target[key]
+    if isinstance(current, dict) and isinstance(value, dict):
+        deep_merge(current, value, policy, path, stats)
+    elif current == value:
+        stats.preserved.extend(leaf_paths(current, path))
+    elif policy == "fail":
+        raise MergeConflict(f"{'.'.join(path)}: file has {current!r}, patch has {value!r}")
+    elif policy == "file-wins":
+        stats.kept.extend(leaf_paths(current, path))
+    else:
+        target[key] = copy.deepcopy(value)
+        stats.overwritten.extend(leaf_paths(value, path))
+
+
+def _check_policy(policy):
+    if policy not in POLICIES:
+        raise ValueError(f"unknown merge policy {policy!r}, expected one of {', '.join(POLICIES)}")
+
+
+def deep_merge(target, patch, policy="patch-wins", path=(), stats=None):
+    """Merge patch into target in place and return the MergeStats"""
+    _check_policy(policy)
+    if stats is None:
+        stats = MergeStats()
+
+    for key, value in patch.items():
+        _merge_key(target, key, value, policy, path + (key,), stats)
+    for key, current in target.items():
+        if key not in patch:
+            stats.preserved.extend(leaf_paths(current, path + (key,)))
+    return stats
+
+
+def merge_at(data, path, value, policy="patch-wins", stats=None):
+    """
+    Deep-merge value into data at a key path, creating intermediate sections.
+    Only the section at path is walked; its siblings are not reported.
+    """
+    _check_policy(policy)
+    if stats is None:
+        stats = MergeStats()
+
+    node = data
+    for key in path[:-1]:
+        node = node.setdefault(key, {})
+    _merge_key(node, path[-1], value, policy, tuple(path), stats)
+    return stats
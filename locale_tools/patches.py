@@ -0,0 +1,177 @@
+"""
+Discovery of patch sets.
+
+Patch sets live under src/i18n/patches, one directory per patch set and one
+JSON payload per language::
+
+    src/i18n/patches/seo_translations/fr.json
+
+Small fragments can also be dropped next to the locales as
+``<lang>-<name>-update.json``. Every fragment with the same name forms one
+patch set, applied after the patch set directories in name order, whose
+top-level sections are deep-merged into the base locale like any other patch.
+
+Payloads for a language that has no base locale are skipped with a warning;
+add ``<lang>.json`` to the locales to start patching it.
+
+Discovery only lists the directories; a language's payload is read the first
+time that language is targeted, so startup cost and memory scale with the
+languages actually processed.
+"""
+
+import json
+import os
+import re
+from collections.abc import Mapping
+
+from .config import LOCALE_DIR, PATCH_DIR, PATCH_SET_NAMES, site_root
+from .manifest import file_hash, ops_hash
+
+# Loose fragments next to the locales: <lang>-<name>-update.json
+FRAGMENT_RE = re.compile(r"^([a-z]{2,3}(?:-[A-Z]{2})?)-([\w-]+)-update\.json$")
+
+# Payload files are named after the language they target
+PAYLOAD_RE = re.compile(r"^([a-z]{2,3}(?:-[A-Z]{2})?)\.json$")
+
+# Flat payload keys that target a nested path in the locale
+KEY_ALIASES = {
+    "nav_vr": ("nav", "vr"),
+}
+
+
+def _payload_ops(name, payload):
+    """Turn one language payload into (path, value) assignments"""
+    if name == "seo_translations":
+        return [(("seo",), payload)]
+    return [(KEY_ALIASES.get(key, (key,)), value) for key, value in payload.items()]
+
+
+def _fragment_ops(name, payload):
+    """A fragment is merged section by section into the locale root"""
+    return [((key,), value) for key, value in payload.items()]
+
+
+class LazyOps(Mapping):
+    """{lang: ops} whose payload files are only read when a language is looked up"""
+
+    def __init__(self, name, files, to_ops=_payload_ops):
+        self.name = name
+        self.files = files
+        self.to_ops = to_ops
+        self._loaded = {}
+
+    def __getitem__(self, lang):
+        if lang not in self._loaded:
+            with open(self.files[lang], "r", encoding="utf-8") as f:
+                self._loaded[lang] = self.to_ops(self.name, json.load(f))
+        return self._loaded[lang]
+
+    def digest(self, lang):
+        """Hash of a language's payload file, without parsing it"""
+        return file_hash(self.files[lang])
+
+    def __iter__(self):
+        return iter(self.files)
+
+    def __len__(self):
+        return len(self.files)
+
+
+class PatchSet:
+    """A named set of per-language operations"""
+
+    def __init__(self, name, source, ops):
+        self.name = name
+        self.source = source
+        self.ops = ops
+
+    def languages(self):
+        return list(self.ops)
+
+    def digest(self, lang):
+        """Identity of one language's payload, as recorded in the journal"""
+        if isinstance(self.ops, LazyOps):
+            return self.ops.digest(lang)
+        return ops_hash(self.ops[lang])
+
+    def __repr__(self):
+        return f"PatchSet({self.name!r}, {self.source!r}, {len(self.ops)} languages)"
+
+
+def _payload_files(directory):
+    files = {}
+    for name in sorted(os.listdir(directory)):
+        match = PAYLOAD_RE.match(name)
+        if match:
+            files[match.group(1)] = os.path.join(directory, name)
+    return files
+
+
+def _base_languages(locale_dir):
+    """Languages that have a base locale file to patch"""
+    if not os.path.isdir(locale_dir):
+        return set()
+    return {match.group(1) for match in map(PAYLOAD_RE.match, os.listdir(locale_dir)) if match}
+
+
+def _targeted_payloads(directory, languages, warn=False):
+    """Payload files of a patch set whose language has a base locale; the others are skipped"""
+    files = _payload_files(directory)
+    for lang in [lang for lang in files if lang not in languages]:
+        if warn:
+            print(f"⚠ {files[lang]}: no {lang}.json locale to patch, skipped")
+        del files[lang]
+    return files
+
+
+def _fragment_files(locale_dir):
+    """{name: {lang: path}} for every fragment whose base locale exists"""
+    fragments = {}
+    if not os.path.isdir(locale_dir):
+        return fragments
+    names = sorted(os.listdir(locale_dir))
+    for name in names:
+        match = FRAGMENT_RE.match(name)
+        if match and f"{match.group(1)}.json" in names:
+            fragments.setdefault(f"{match.group(2)}-update", {})[match.group(1)] = os.path.join(locale_dir, name)
+    return dict(sorted(fragments.items()))
+
+
+def patch_sources(patch_dir=PATCH_DIR, locale_dir=LOCALE_DIR):
+    """Paths of every payload and fragment file"""
+    paths = []
+    if os.path.isdir(patch_dir):
+        languages = _base_languages(locale_dir)
+        paths = [
+            path
+            for entry in sorted(os.scandir(patch_dir), key=lambda entry: entry.name)
+            if entry.is_dir()
+            for path in _targeted_payloads(entry.path, languages).values()
+        ]
+    for files in _fragment_files(locale_dir).values():
+        paths.extend(files.values())
+    return paths
+
+
+def discover_patch_sets(patch_dir=PATCH_DIR, locale_dir=LOCALE_DIR):
+    """
+    Find every patch set: known names in PATCH_SET_NAMES order first, then the
+    other directories by name, then the fragments in locale_dir by name.
+    """
+    root = site_root(locale_dir)
+    patch_sets = []
+    if os.path.isdir(patch_dir):
+        languages = _base_languages(locale_dir)
+        names = sorted(entry.name for entry in os.scandir(patch_dir) if entry.is_dir())
+        ordered = [name for name in PATCH_SET_NAMES if name in names]
+        ordered += [name for name in names if name not in PATCH_SET_NAMES]
+        for name in ordered:
+            directory = os.path.join(patch_dir, name)
+            source = os.path.relpath(directory, root)
+            files = _targeted_payloads(directory, languages, warn=True)
+            patch_sets.append(PatchSet(name, source, LazyOps(name, files)))
+
+    for name, files in _fragment_files(locale_dir).items():
+        source = os.path.relpath(os.path.join(locale_dir, f"*-{name}.json"), root)
+        patch_sets.append(PatchSet(name, source, LazyOps(name, files, _fragment_ops)))
+    return patch_sets
@@ -0,0 +1,67 @@
+"""
+Placeholder consistency across languages.
+
+i18next interpolates ``{{name}}`` (optionally ``{{name, format}}``) at
+runtime, so a translation that drops or renames a placeholder only shows up
+in the browser. Every string of every locale is scanned once for its
+placeholder set, and each language is compared key by key against the
+source language.
+"""
+
+import re
+
+PLACEHOLDER_RE = re.compile(r"\{\{\s*([^{},\s]+)\s*(?:,[^{}]*)?\}\}")
+
+NO_PLACEHOLDERS = frozenset()
+
+
+def placeholders_in(text):
+    names = PLACEHOLDER_RE.findall(text)
+    return frozenset(names) if names else NO_PLACEHOLDERS
+
+
+def extract_placeholders(data):
+    """Return {dot.path: frozenset of placeholder names} for every string in a tree"""
+    found = {}
+    stack = [("", data)]
+    while stack:
+        prefix, node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            path = f"{prefix}.{key}" if prefix else str(key)
+            if isinstance(value, str):
+                found[path] = placeholders_in(value)
+            elif isinstance(value, (dict, list)):
+                stack.append((path, value))
+    return found
+
+
+def extract_from_events(events):
+    """Same as extract_placeholders, from streamed (key_path, value) events"""
+    return {
+        ".".join(map(str, key_path)): placeholders_in(value)
+        for key_path, value in events
+        if isinstance(value, str)
+    }
+
+
+def compare_placeholders(source, target):
+    """Keys present in both languages whose placeholder sets differ"""
+    mismatches = {}
+    for path in source.keys() & target.keys():
+        expected, found = source[path], target[path]
+        if expected != found:
+            mismatches[path] = {
+                "missing": sorted(expected - found),
+                "unexpected": sorted(found - expected),
+            }
+    return dict(sorted(mismatches.items()))
+
+
+def describe(path, mismatch):
+    parts = []
+    if mismatch["missing"]:
+        parts.append("missing " + ", ".join(f"{{{{{name}}}}}" for name in mismatch["missing"]))
+    if mismatch["unexpected"]:
+        parts.append("unexpected " + ", ".join(f"{{{{{name}}}}}" for name in mismatch["unexpected"]))
+    return f"{path}: {'; '.join(parts)}"
@@ -0,0 +1,178 @@
+"""
+Prerendered SEO head tags per language and route.
+
+SEO.tsx only sets the title, description, keywords and hreflang alternates
+once React has booted and the locale is loaded. This build stage reads the
+``seo`` section of every locale and writes, for each language and route,
+either a copy of the built ``index.html`` with those tags already in its
+``<head>`` (``<out>/<lang>/<slug>.html``) or just the head fragment
+(``<out>/<lang>/<slug>.head.html``). vercel.json rewrites each route, and
+its ``?lang=`` alternates, to the matching file, so crawlers and first
+paint get the right metadata without JavaScript. Those rewrites are
+generated from ROUTES and the locale files by ``vercel_rewrites``, so they
+cannot drift from the pages that exist.
+
+Tags mirror SEO.tsx and src/config/seoConfig.ts; keep them in step.
+"""
+
+import html
+import json
+import os
+import re
+
+from .config import DIST_DIR, LOCALE_DIR, SOURCE_LANGUAGE
+from .engine import discover_languages, load_locale, locale_path, write_if_changed
+
+# seoConfig.siteUrl
+SITE_URL = "https://devotionsim.com"
+
+# Route -> (seo section, path SEO.tsx is given for canonical and hreflang URLs)
+ROUTES = {
+    "/": ("home", "/"),
+    "/simulators": ("simulators", "/simulators"),
+    "/reviews/clients": ("reviews", "/reviews"),
+    "/reviews/pilots": ("reviews", "/reviews"),
+    "/events": ("events", "/events"),
+    "/rent-purchase": ("rentPurchase", "/rent-purchase"),
+    "/about": ("about", "/about"),
+    "/contact": ("contact", "/contact"),
+    "/virtual-reality": ("vr", "/virtual-reality"),
+}
+
+# Language of a route requested without ?lang=, as <html lang> in index.html
+DEFAULT_LANGUAGE = "es"
+
+# og:locale values, as in index.html
+OG_LOCALES = {
+    "ca": "ca_ES",
+    "de": "de_DE",
+    "en": "en_GB",
+    "es": "es_ES",
+    "fr": "fr_FR",
+    "it": "it_IT",
+    "nl": "nl_NL",
+    "pt": "pt_PT",
+}
+
+# Tags in the template that the prerendered head replaces, each with its line
+REPLACED_TAG_RE = re.compile(
+    r"[ \t]*(?:<title>.*?</title>"
+    r"|<meta\s+(?:name|property)=\"(?:title|description|keywords|og:url|og:title|og:description"
+    r"|og:locale(?::alternate)?|twitter:url|twitter:title|twitter:description)\"[^>]*>"
+    r"|<link\s+rel=\"(?:canonical|alternate)\"[^>]*>)[ \t]*\n?",
+    re.DOTALL,
+)
+HTML_LANG_RE = re.compile(r"<html\b[^>]*>")
+
+
+def route_slug(route):
+    return route.strip("/").replace("/", "-") or "index"
+
+
+def _seo_strings(seo, fallback, section):
+    """Title, description and keywords of a section, falling back to the source language"""
+    strings = dict(fallback.get(section, {}))
+    strings.update(seo.get(section, {}))
+    site = {**fallback.get("site", {}), **seo.get("site", {})}
+    return (
+        strings.get("title") or site.get("name", ""),
+        strings.get("description") or site.get("defaultDescription", ""),
+        strings.get("keywords", ""),
+    )
+
+
+def head_tags(lang, route, seo, fallback, languages):
+    """The <head> tags for one language and route, one per line"""
+    section, path = ROUTES[route]
+    title, description, keywords = _seo_strings(seo, fallback, section)
+    url = html.escape(SITE_URL + path)
+
+    tags = [f"<title>{html.escape(title)}</title>"]
+    if description:
+        tags.append(f'<meta name="description" content="{html.escape(description)}" />')
+    if keywords:
+        tags.append(f'<meta name="keywords" content="{html.escape(keywords)}" />')
+    tags.append(f'<link rel="canonical" href="{url}" />')
+    for other in languages:
+        tags.append(f'<link rel="alternate" hreflang="{other}" href="{url}?lang={other}" />')
+    tags.append(f'<link rel="alternate" hreflang="x-default" href="{url}" />')
+
+    tags.append(f'<meta property="og:url" content="{url}" />')
+    tags.append(f'<meta property="og:title" content="{html.escape(title)}" />')
+    if description:
+        tags.append(f'<meta property="og:description" content="{html.escape(description)}" />')
+    tags.append(f'<meta property="og:locale" content="{OG_LOCALES.get(lang, lang)}" />')
+    for other in languages:
+        if other != lang:
+            tags.append(f'<meta property="og:locale:alternate" content="{OG_LOCALES.get(other, other)}" />')
+
+    tags.append(f'<meta name="twitter:url" content="{url}" />')
+    tags.append(f'<meta name="twitter:title" content="{html.escape(title)}" />')
+    if description:
+        tags.append(f'<meta name="twitter:description" content="{html.escape(description)}" />')
+    return tags
+
+
+def render_page(template, lang, tags):
+    """The template with its own copies of the tags removed and the prerendered ones in <head>"""
+    page = REPLACED_TAG_RE.sub("", template)
+    page = HTML_LANG_RE.sub(f'<html lang="{lang}">', page, count=1)
+    block = "".join(f"  {tag}\n" for tag in tags)
+    return page.replace("</head>", block + "</head>", 1)
+
+
+def prerender(locale_dir=LOCALE_DIR, template=os.path.join(DIST_DIR, "index.html"),
+              out_dir=os.path.join(DIST_DIR, "seo"), fragments=False, source_lang=SOURCE_LANGUAGE):
+    """
+    Write the prerendered pages (or only the head fragments) for every
+    language and route. Returns the number of files written.
+    """
+    if not fragments:
+        with open(template, "r", encoding="utf-8") as f:
+            template = f.read()
+
+    languages = discover_languages(locale_dir)
+    fallback = load_locale(locale_path(source_lang, locale_dir)).get("seo", {})
+    written = 0
+    for lang in languages:
+        seo = load_locale(locale_path(lang, locale_dir)).get("seo", {})
+        for route in ROUTES:
+            tags = head_tags(lang, route, seo, fallback, languages)
+            if fragments:
+                path = os.path.join(out_dir, lang, f"{route_slug(route)}.head.html")
+                text = "\n".join(tags) + "\n"
+            else:
+                path = os.path.join(out_dir, lang, f"{route_slug(route)}.html")
+                text = render_page(template, lang, tags)
+            written += write_if_changed(path, text)
+    return written
+
+
+def vercel_rewrites(languages, default_lang=DEFAULT_LANGUAGE, seo_url="/seo"):
+    """The vercel.json rewrites serving each route, and its ?lang= alternates, from its prerendered page"""
+    has_lang = [{"type": "query", "key": "lang", "value": f"(?<lang>{'|'.join(languages)})"}]
+    rewrites = []
+    for route in ROUTES:
+        page = f"{route_slug(route)}.html"
+        rewrites.append({"source": route, "has": has_lang, "destination": f"{seo_url}/:lang/{page}"})
+        rewrites.append({"source": route, "destination": f"{seo_url}/{default_lang}/{page}"})
+    return rewrites
+
+
+def update_vercel_config(path, locale_dir=LOCALE_DIR, write=True):
+    """
+    Put the generated prerender rewrites first in vercel.json's rewrites,
+    replacing the previous ones and keeping every other rewrite after them.
+    Returns whether they were out of date; with write False nothing is written.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    current = config.get("rewrites", [])
+    others = [rewrite for rewrite in current if not rewrite["destination"].startswith("/seo/")]
+    rewrites = vercel_rewrites(discover_languages(locale_dir)) + others
+    if rewrites == current:
+        return False
+    if write:
+        config["rewrites"] = rewrites
+        write_if_changed(path, json.dumps(config, ensure_ascii=False, indent=4))
+    return True
@@ -0,0 +1,97 @@
+"""
+Phase-level instrumentation for the locale pipeline.
+
+A Profiler records wall time, and optionally the peak traced memory, of
+named phases (discovery, read, parse, merge, validate, serialize, write), per
+locale and in total. Workers run their own Profiler and hand the records back
+to the parent, which merges them. The result can be written as a JSON report
+or as folded stacks for flamegraph.pl / speedscope.
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+def _accumulate(bucket, record):
+    entry = bucket.setdefault(record["phase"], {"seconds": 0.0, "peakBytes": None})
+    entry["seconds"] += record["seconds"]
+    if record["peakBytes"] is not None:
+        entry["peakBytes"] = max(entry["peakBytes"] or 0, record["peakBytes"])
+
+
+class Profiler:
+    """Collects (phase, locale, seconds, peak bytes) records"""
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.records = []
+        self._started_tracing = False
+        self._start = time.perf_counter()
+
+    def start(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def phase(self, name, locale=None):
+        """Time a phase; with memory tracing, also record its peak allocation"""
+        if self.memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] - baseline if self.memory else None
+            self.records.append({"phase": name, "locale": locale, "seconds": seconds, "peakBytes": peak})
+
+    def extend(self, records):
+        self.records.extend(records)
+
+    def timings(self, locale=None):
+        """Seconds per phase, for one locale or summed over all records"""
+        totals = {}
+        for record in self.records:
+            if locale is None or record["locale"] == locale:
+                totals[record["phase"]] = totals.get(record["phase"], 0.0) + record["seconds"]
+        return totals
+
+    def report(self):
+        """JSON-ready report with totals per phase and a breakdown per locale"""
+        phases, locales = {}, {}
+        for record in self.records:
+            _accumulate(phases, record)
+            if record["locale"]:
+                _accumulate(locales.setdefault(record["locale"], {}), record)
+        return {
+            "wall": time.perf_counter() - self._start,
+            "memory": self.memory,
+            "phases": phases,
+            "locales": locales,
+        }
+
+    def folded(self, root="sync"):
+        """Folded stack lines (``sync;en;parse 1234``) with microsecond weights"""
+        weights = {}
+        for record in self.records:
+            frames = [root] + ([record["locale"]] if record["locale"] else []) + [record["phase"]]
+            stack = ";".join(frames)
+            weights[stack] = weights.get(stack, 0) + round(record["seconds"] * 1_000_000)
+        return "".join(f"{stack} {weight}\n" for stack, weight in weights.items())
+
+    def write(self, path, folded_path=None):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        if folded_path:
+            with open(folded_path, "w", encoding="utf-8") as f:
+                f.write(self.folded())
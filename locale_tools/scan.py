@@ -0,0 +1,122 @@
+"""
+Unused / undefined translation key scanner for the React sources.
+
+Every ``.ts``/``.tsx`` file under src is read in a thread pool and scanned
+with one compiled multi-pattern matcher that picks up:
+
+* ``t('a.b')`` / ``t("a.b")`` calls, checked against the source locale;
+* ``t(`a.${x}.b`)`` template calls, which mark every key they can match;
+* any other string literal that is a key path (``label: "products.trust.pro"``),
+  for keys that reach ``t()`` through data.
+
+Keys present in some locale but never reached are reported as unused; keys
+passed literally to ``t()`` that do not exist in the source locale are
+reported as undefined, noting whether the call carries an inline default.
+"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import LOCALE_DIR, SRC_DIR
+from .coverage import SOURCE_LANGUAGE
+from .engine import discover_languages
+from .keyindex import KeyIndex
+
+SOURCE_EXTENSIONS = (".ts", ".tsx")
+
+KEY_MATCHER = re.compile(
+    r"""
+    \bt\(\s*(?P<q>['"])(?P<call>[^'"\s]+)(?P=q)(?P<default>\s*,\s*['"`])?   # t('a.b'[, 'default'])
+    | \bt\(\s*`(?P<template>[^`]+)`                     # t(`a.${x}.b`)
+    | (?P<lq>['"])(?P<literal>[A-Za-z_]\w*(?:\.\w+)+)(?P=lq)   # "a.b" anywhere else
+    """,
+    re.VERBOSE,
+)
+
+# i18next plural forms a t('key', { count }) call may resolve to
+PLURAL_SUFFIXES = ("_zero", "_one", "_two", "_few", "_many", "_other")
+
+
+def source_files(src_dir=SRC_DIR):
+    for dirpath, dirnames, filenames in os.walk(src_dir):
+        dirnames[:] = [d for d in dirnames if d != "node_modules"]
+        for name in filenames:
+            if name.endswith(SOURCE_EXTENSIONS):
+                yield os.path.join(dirpath, name)
+
+
+def scan_file(path):
+    """
+    Return (path, calls, templates, literals) found in one source file;
+    calls maps each t() key to whether the call passes an inline default.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    calls, templates, literals = {}, set(), set()
+    for match in KEY_MATCHER.finditer(text):
+        if match.group("call"):
+            key = match.group("call")
+            calls[key] = calls.get(key, False) or bool(match.group("default"))
+        elif match.group("template"):
+            templates.add(match.group("template"))
+        else:
+            literals.add(match.group("literal"))
+    return path, calls, templates, literals
+
+
+def template_regex(template):
+    """t(`a.${x}.b`) -> a regex matching every key the template can produce"""
+    parts = re.split(r"\$\{[^}]*\}", template)
+    return re.compile("[^.]+".join(re.escape(part) for part in parts) + r"(?:\..+)?$")
+
+
+def _with_descendants(paths, index):
+    """Expand section paths to every key underneath them"""
+    found = set(paths)
+    for path in paths:
+        found.update(index.query(path + ".**"))
+    return found
+
+
+def scan_usage(src_dir=SRC_DIR, locale_dir=LOCALE_DIR, source_lang=SOURCE_LANGUAGE, jobs=8):
+    """Cross-reference key usage in the sources with the locale key sets"""
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(scan_file, sorted(source_files(src_dir))))
+
+    index = KeyIndex.build(locale_dir, sorted(set(discover_languages(locale_dir)) | {source_lang}))
+    source = index.flat(source_lang)
+    leaves = index.leaves()
+
+    all_keys = set(leaves) | set(source)
+    sorted_keys = sorted(all_keys)
+    used, undefined, templates = set(), {}, set()
+    for path, calls, file_templates, literals in results:
+        rel = os.path.relpath(path, src_dir)
+        templates |= file_templates
+        used |= literals & all_keys
+        for key, has_default in calls.items():
+            forms = {key + suffix for suffix in PLURAL_SUFFIXES} & all_keys
+            used.add(key)
+            used |= forms
+            if key not in source and not forms & source.keys():
+                entry = undefined.setdefault(key, {"files": [], "hasDefault": False})
+                entry["files"].append(rel)
+                entry["hasDefault"] = entry["hasDefault"] or has_default
+
+    used = _with_descendants(used & all_keys, index)
+    for template in templates:
+        pattern = template_regex(template)
+        used.update(key for key in sorted_keys if pattern.match(key))
+
+    unused = {path: langs for path, langs in sorted(leaves.items()) if path not in used}
+    return {
+        "files": len(results),
+        "source": source_lang,
+        "keys": len(leaves),
+        "used": len(used & set(leaves)),
+        "templates": sorted(templates),
+        "unused": unused,
+        "undefined": dict(sorted(undefined.items())),
+    }
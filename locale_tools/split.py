@@ -0,0 +1,97 @@
+"""
+Namespace-split locale output for lazy loading.
+
+Every top-level section of a locale becomes its own chunk, written as
+``<out>/<lang>/<namespace>.json``. ``manifest.json`` in the output directory
+lists the chunks per language with their size and hash so a lazy backend can
+fetch just the language and namespaces a page needs.
+"""
+
+import json
+import os
+
+from .config import ADMIN_NAMESPACES, LOCALE_DIR, NAMESPACE_DIR
+from .engine import (
+    discover_languages,
+    dump_compact,
+    load_locale,
+    locale_path,
+    write_if_changed,
+)
+from .manifest import content_hash
+
+SPLIT_MANIFEST_NAME = "manifest.json"
+
+
+def split_locale(data):
+    """Map each top-level section to its own namespace"""
+    return {namespace: section for namespace, section in data.items()}
+
+
+def _remove_stale_chunks(lang_dir, keep):
+    removed = []
+    if not os.path.isdir(lang_dir):
+        return removed
+    for name in os.listdir(lang_dir):
+        if name.endswith(".json") and name[:-5] not in keep:
+            os.remove(os.path.join(lang_dir, name))
+            removed.append(name)
+    return removed
+
+
+def load_split_manifest(out_dir=NAMESPACE_DIR):
+    try:
+        with open(os.path.join(out_dir, SPLIT_MANIFEST_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"languages": {}, "adminNamespaces": list(ADMIN_NAMESPACES)}
+
+
+def save_split_manifest(manifest, out_dir=NAMESPACE_DIR):
+    text = json.dumps(manifest, ensure_ascii=False, indent=2)
+    return write_if_changed(os.path.join(out_dir, SPLIT_MANIFEST_NAME), text)
+
+
+def split_language(lang, locale_dir=LOCALE_DIR, out_dir=NAMESPACE_DIR, data=None):
+    """
+    Write the namespace chunks of one language, skipping unchanged ones.
+    Returns the manifest entries and the namespaces that were rewritten.
+    """
+    if data is None:
+        data = load_locale(locale_path(lang, locale_dir))
+    namespaces = split_locale(data)
+    lang_dir = os.path.join(out_dir, lang)
+    entries, rewritten = {}, []
+
+    for namespace, section in namespaces.items():
+        text = dump_compact(section)
+        if write_if_changed(os.path.join(lang_dir, f"{namespace}.json"), text):
+            rewritten.append(namespace)
+        entries[namespace] = {
+            "path": f"{lang}/{namespace}.json",
+            "bytes": len(text.encode("utf-8")),
+            "hash": content_hash(text)[:12],
+        }
+
+    for name in _remove_stale_chunks(lang_dir, namespaces):
+        print(f"✓ Removed stale chunk {lang}/{name}")
+    return entries, rewritten
+
+
+def split_all(locale_dir=LOCALE_DIR, out_dir=NAMESPACE_DIR, languages=None):
+    """Write namespace chunks for every language (or just the given ones) plus the chunk manifest"""
+    if languages:
+        manifest = load_split_manifest(out_dir)
+    else:
+        languages = discover_languages(locale_dir)
+        manifest = {"languages": {}, "adminNamespaces": list(ADMIN_NAMESPACES)}
+    written = 0
+
+    for lang in languages:
+        entries, rewritten = split_language(lang, locale_dir, out_dir)
+        written += len(rewritten)
+        manifest["languages"][lang] = entries
+        print(f"✓ Split {lang}.json into {len(entries)} namespaces")
+
+    written += save_split_manifest(manifest, out_dir)
+    return manifest, written
@@ -0,0 +1,94 @@
+"""
+Source-hash staleness tracking.
+
+``.locale-sources.json`` next to the locales records, for every translated
+key, a hash of the source-language string it was translated from. The sync
+records it whenever a patch adds or overwrites a translation. Finding the
+stale translations is then one pass over the source locale: hash each of its
+strings and compare with what every language recorded, without loading the
+other locales at all. Only keys whose source string changed are reported.
+"""
+
+import json
+import os
+
+from .config import SOURCE_LANGUAGE
+from .manifest import content_hash, file_hash
+
+SOURCES_NAME = ".locale-sources.json"
+SOURCES_VERSION = 1
+
+# Hash characters kept per string
+HASH_LENGTH = 12
+
+
+def sources_path(locale_dir):
+    return os.path.join(locale_dir, SOURCES_NAME)
+
+
+def load_sources(locale_dir, source_lang=SOURCE_LANGUAGE):
+    try:
+        with open(sources_path(locale_dir), "r", encoding="utf-8") as f:
+            sources = json.load(f)
+    except FileNotFoundError:
+        return {"version": SOURCES_VERSION, "source": source_lang, "languages": {}}
+
+    if sources.get("version") != SOURCES_VERSION:
+        raise ValueError(f"{sources_path(locale_dir)}: unsupported version {sources.get('version')}")
+    return sources
+
+
+def save_sources(locale_dir, sources, txn=None):
+    """Write the record if it changed, staged in txn when one is given"""
+    text = json.dumps(sources, ensure_ascii=False, indent=2, sort_keys=True)
+    path = sources_path(locale_dir)
+    if file_hash(path) == content_hash(text):
+        return
+    if txn is not None:
+        txn.stage(path, text)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def string_hashes(data):
+    """{dot path: hash} of every leaf of a locale, in one walk"""
+    hashes = {}
+    stack = [("", data)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            path = f"{prefix}.{key}" if prefix else key
+            if isinstance(value, dict):
+                stack.append((path, value))
+            else:
+                hashes[path] = content_hash(json.dumps(value, ensure_ascii=False))[:HASH_LENGTH]
+    return hashes
+
+
+def record_translations(sources, lang, paths, hashes):
+    """Mark the translations at paths as made from the current source strings"""
+    recorded = sources["languages"].setdefault(lang, {})
+    for path in paths:
+        if path in hashes:
+            recorded[path] = hashes[path]
+
+
+def baseline(sources, lang, data, hashes):
+    """Record every translated key that has no entry yet as up to date; returns how many"""
+    recorded = sources["languages"].setdefault(lang, {})
+    untracked = [path for path in string_hashes(data) if path in hashes and path not in recorded]
+    record_translations(sources, lang, untracked, hashes)
+    return len(untracked)
+
+
+def stale_keys(sources, hashes, languages=None):
+    """{lang: sorted dot paths} whose source string changed since they were translated"""
+    stale = {}
+    for lang, recorded in sources["languages"].items():
+        if languages and lang not in languages:
+            continue
+        changed = sorted(path for path, digest in recorded.items() if path in hashes and hashes[path] != digest)
+        if changed:
+            stale[lang] = changed
+    return stale
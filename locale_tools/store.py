@@ -0,0 +1,354 @@
+"""
+SQLite translation store.
+
+Every leaf of every locale is one row keyed by (lang, dot path), with its
+value as JSON text and a position that keeps document order. The primary key
+is the index for point lookups and partial updates; a second index on
+(lang, position) lets a language be exported in one ordered scan, streamed
+straight into ``<lang>.json`` in the exact layout of src/i18n/locales.
+
+Subtree queries use the key index as a range: every path under ``seo.vr``
+sorts between ``seo.vr.`` and ``seo.vr/``, because "/" follows "." in ASCII.
+
+The JSON locales stay the source of truth and the store is a working copy
+of them. Importing patch sets honours the journal, so only pending payloads
+are merged. Export only writes the languages edited in the store, and
+refuses when their file changed on disk since the import, so it never
+overwrites a sync or a hand edit with older rows. The files are written in
+one transaction, under the locale directory's lock, together with the
+journal, manifest and source-hash record, exactly as a sync would.
+"""
+
+import json
+import os
+import sqlite3
+
+from .config import LOCALE_DIR, PATCH_DIR, SOURCE_LANGUAGE, STORE_PATH
+from .engine import discover_languages, load_locale, locale_path
+from .journal import is_applied, load_journal, record_payload, save_journal, upgrade_journal
+from .manifest import content_hash, file_hash, load_manifest, save_manifest
+from .merge import leaf_paths
+from .patches import discover_patch_sets
+from .staleness import HASH_LENGTH, load_sources, record_translations, save_sources
+from .transaction import Transaction, locked, recover
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS strings (
+    lang TEXT NOT NULL,
+    path TEXT NOT NULL,
+    position REAL NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (lang, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS strings_order ON strings (lang, position);
+CREATE TABLE IF NOT EXISTS pending_patches (
+    name TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    source TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    paths TEXT NOT NULL,
+    PRIMARY KEY (name, lang)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS imports (
+    lang TEXT PRIMARY KEY,
+    file_hash TEXT,
+    changed INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+"""
+
+# Indent of the locale files, as written by dump_locale
+INDENT = "  "
+
+
+class StoreConflict(ValueError):
+    """Raised when a locale file changed on disk after it was imported into the store"""
+
+
+def connect(path=STORE_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def split_path(path):
+    return tuple(path.split(".")) if path else ()
+
+
+def leaves(data, prefix=()):
+    """(key path, value) of every leaf in document order; empty sections are leaves too"""
+    for key, value in data.items():
+        if "." in key:
+            raise ValueError(f"{'.'.join(prefix + (key,))}: keys containing '.' cannot be stored")
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            yield from leaves(value, path)
+        else:
+            yield path, value
+
+
+def _encode(value):
+    return json.dumps(value, ensure_ascii=False)
+
+
+def import_locale(conn, lang, data, digest=None):
+    """
+    Replace a language with the contents of a parsed locale, remembering the
+    hash of the file it came from; returns the number of leaves
+    """
+    rows = [
+        (lang, ".".join(path), float(position), _encode(value))
+        for position, (path, value) in enumerate(leaves(data))
+    ]
+    with conn:
+        conn.execute("DELETE FROM strings WHERE lang = ?", (lang,))
+        conn.execute("DELETE FROM pending_patches WHERE lang = ?", (lang,))
+        conn.executemany("INSERT INTO strings (lang, path, position, value) VALUES (?, ?, ?, ?)", rows)
+        conn.execute("INSERT OR REPLACE INTO imports (lang, file_hash, changed) VALUES (?, ?, 0)", (lang, digest))
+    return len(rows)
+
+
+def import_locales(conn, locale_dir=LOCALE_DIR, languages=None):
+    """Bulk-import the JSON locales; returns {lang: leaves}"""
+    counts = {}
+    for lang in languages or discover_languages(locale_dir):
+        path = locale_path(lang, locale_dir)
+        counts[lang] = import_locale(conn, lang, load_locale(path), file_hash(path))
+    return counts
+
+
+def stored_languages(conn):
+    return [lang for (lang,) in conn.execute("SELECT DISTINCT lang FROM strings ORDER BY lang")]
+
+
+def _subtree_range(path):
+    return path + ".", path + "/"
+
+
+def lookup(conn, lang, path):
+    """The value at a dot path, rebuilding a section from its leaves; KeyError if absent"""
+    row = conn.execute("SELECT value FROM strings WHERE lang = ? AND path = ?", (lang, path)).fetchone()
+    if row:
+        return json.loads(row[0])
+
+    low, high = _subtree_range(path)
+    rows = conn.execute(
+        "SELECT path, value FROM strings WHERE lang = ? AND path > ? AND path < ? ORDER BY position",
+        (lang, low, high),
+    )
+    section = {}
+    for leaf, value in rows:
+        node = section
+        keys = split_path(leaf[len(low):])
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = json.loads(value)
+    if not section:
+        raise KeyError(path)
+    return section
+
+
+def _position_after(conn, lang, path):
+    """A position just after the last leaf under the deepest existing ancestor of path"""
+    keys = split_path(path)
+    for depth in range(len(keys) - 1, 0, -1):
+        low, high = _subtree_range(".".join(keys[:depth]))
+        (last,) = conn.execute(
+            "SELECT MAX(position) FROM strings WHERE lang = ? AND path > ? AND path < ?", (lang, low, high)
+        ).fetchone()
+        if last is not None:
+            break
+    else:
+        last = conn.execute("SELECT MAX(position) FROM strings WHERE lang = ?", (lang,)).fetchone()[0]
+        return (last or 0.0) + 1.0
+
+    (following,) = conn.execute(
+        "SELECT MIN(position) FROM strings WHERE lang = ? AND position > ?", (lang, last)
+    ).fetchone()
+    return last + 1.0 if following is None else (last + following) / 2
+
+
+def _set(conn, lang, path, value):
+    conn.execute(
+        "INSERT INTO imports (lang, file_hash, changed) VALUES (?, NULL, 1) ON CONFLICT (lang) DO UPDATE SET changed = 1",
+        (lang,),
+    )
+    keys = split_path(path)
+    low, high = _subtree_range(path)
+    # The path itself, everything under it and any ancestor stored as a leaf
+    # (a string or empty section) are replaced by the new rows
+    replaced = [".".join(keys[:depth]) for depth in range(1, len(keys))] + [path]
+    marks = ", ".join("?" * len(replaced))
+    where = f"lang = ? AND (path IN ({marks}) OR (path > ? AND path < ?))"
+    params = (lang, *replaced, low, high)
+
+    (position,) = conn.execute(f"SELECT MIN(position) FROM strings WHERE {where}", params).fetchone()
+    conn.execute(f"DELETE FROM strings WHERE {where}", params)
+    if position is None:
+        position = _position_after(conn, lang, path)
+
+    if isinstance(value, dict) and value:
+        rows = [(".".join(keys + sub), sub_value) for sub, sub_value in leaves(value)]
+    else:
+        rows = [(path, value)]
+    (following,) = conn.execute(
+        "SELECT MIN(position) FROM strings WHERE lang = ? AND position > ?", (lang, position)
+    ).fetchone()
+    step = ((following - position) if following is not None else 1.0) / (len(rows) + 1)
+    conn.executemany(
+        "INSERT INTO strings (lang, path, position, value) VALUES (?, ?, ?, ?)",
+        [(lang, leaf, position + i * step, _encode(leaf_value)) for i, (leaf, leaf_value) in enumerate(rows)],
+    )
+    return len(rows)
+
+
+def set_value(conn, lang, path, value):
+    """
+    Assign value at a dot path with indexed row operations only. A section
+    replaces everything under the path; new keys go after their siblings.
+    """
+    with conn:
+        return _set(conn, lang, path, value)
+
+
+def merge_ops(conn, lang, ops):
+    """Apply (key path, value) patch operations as a patch-wins deep merge"""
+    count = 0
+    for path, value in ops:
+        if isinstance(value, dict) and value:
+            for sub, sub_value in leaves(value):
+                count += _set(conn, lang, ".".join(tuple(path) + sub), sub_value)
+        else:
+            count += _set(conn, lang, ".".join(path), value)
+    return count
+
+
+def import_patch_sets(conn, patch_sets, languages=None, journal=None):
+    """
+    Bulk-apply patch set payloads to the stored languages in one transaction,
+    skipping those the journal records as applied. Each merged payload is
+    kept in pending_patches until it is exported. Returns {lang: leaves set}.
+    """
+    stored = set(stored_languages(conn))
+    applied = {}
+    with conn:
+        for patch_set in patch_sets:
+            for lang in patch_set.ops:
+                if lang not in stored or (languages and lang not in languages):
+                    continue
+                if journal is not None and is_applied(journal, patch_set, lang):
+                    continue
+                ops = patch_set.ops[lang]
+                applied[lang] = applied.get(lang, 0) + merge_ops(conn, lang, ops)
+                paths = [leaf for path, value in ops for leaf in leaf_paths(value, tuple(path))]
+                conn.execute(
+                    "INSERT OR REPLACE INTO pending_patches (name, lang, source, digest, paths) VALUES (?, ?, ?, ?, ?)",
+                    (patch_set.name, lang, patch_set.source, patch_set.digest(lang), json.dumps(paths)),
+                )
+    return applied
+
+
+def _leaf_text(value, depth):
+    """A leaf serialized like json.dumps(indent=2) would at this depth"""
+    text = json.dumps(value, ensure_ascii=False, indent=len(INDENT))
+    return text.replace("\n", "\n" + INDENT * depth)
+
+
+def write_language(conn, lang, f):
+    """Stream one language as a locale file, matching dump_locale byte for byte"""
+    rows = conn.execute("SELECT path, value FROM strings WHERE lang = ? ORDER BY position", (lang,))
+    open_keys = []
+    first = True
+    f.write("{")
+    for path, value in rows:
+        keys = split_path(path)
+        common = 0
+        while common < min(len(open_keys), len(keys) - 1) and open_keys[common] == keys[common]:
+            common += 1
+        while len(open_keys) > common:
+            open_keys.pop()
+            f.write("\n" + INDENT * (len(open_keys) + 1) + "}")
+        if not first:
+            f.write(",")
+        for key in keys[common:-1]:
+            f.write("\n" + INDENT * (len(open_keys) + 1) + f"{_encode(key)}: {{")
+            open_keys.append(key)
+        depth = len(open_keys) + 1
+        f.write("\n" + INDENT * depth + f"{_encode(keys[-1])}: {_leaf_text(json.loads(value), depth)}")
+        first = False
+    while open_keys:
+        open_keys.pop()
+        f.write("\n" + INDENT * (len(open_keys) + 1) + "}")
+    f.write("\n}" if not first else "}")
+
+
+def _string_hashes(conn, lang):
+    """
+    staleness.string_hashes of a stored language, straight from the rows:
+    each value is already the JSON text that function hashes
+    """
+    rows = conn.execute("SELECT path, value FROM strings WHERE lang = ? AND value != '{}'", (lang,))
+    return {path: content_hash(value)[:HASH_LENGTH] for path, value in rows}
+
+
+def export_locales(conn, locale_dir=LOCALE_DIR, languages=None, source_lang=SOURCE_LANGUAGE, patch_dir=PATCH_DIR):
+    """
+    Write each language edited in the store to <lang>.json, one ordered scan
+    per language streamed into a staged file, and commit them together with
+    the journal, manifest and source-hash record under the locale directory's
+    lock. Raises StoreConflict, writing nothing, when one of those files
+    changed since it was imported. Returns the languages whose files changed.
+    """
+    imports = {lang: (digest, changed) for lang, digest, changed in conn.execute("SELECT lang, file_hash, changed FROM imports")}
+    languages = [lang for lang in languages or stored_languages(conn) if imports.get(lang, (None, 0))[1]]
+    if not languages:
+        return []
+    written = []
+    with locked(locale_dir):
+        for path in recover(locale_dir):
+            print(f"✓ Completed interrupted write of {os.path.basename(path)}")
+        conflicts = [lang for lang in languages if file_hash(locale_path(lang, locale_dir)) != imports[lang][0]]
+        if conflicts:
+            names = ", ".join(f"{lang}.json" for lang in conflicts)
+            raise StoreConflict(f"{names} changed since the store imported them; re-import before exporting")
+
+        journal = load_journal(locale_dir)
+        upgrade_journal(journal, discover_patch_sets(patch_dir, locale_dir))
+        manifest = load_manifest(locale_dir)
+        translated = load_sources(locale_dir, source_lang)
+        hashes = _string_hashes(conn, source_lang)
+        marks = ", ".join("?" * len(languages))
+        pending = conn.execute(
+            f"SELECT name, lang, source, digest, paths FROM pending_patches WHERE lang IN ({marks})", languages
+        ).fetchall()
+
+        txn = Transaction(locale_dir)
+        outputs = {}
+        try:
+            for lang in languages:
+                path = locale_path(lang, locale_dir)
+                output = path
+                if txn.stage_stream(path, lambda f: write_language(conn, lang, f)):
+                    written.append(lang)
+                    output = txn.staged[-1][0]
+                outputs[lang] = file_hash(output)
+                manifest["locales"].setdefault(lang, {})["output"] = outputs[lang]
+            for name, lang, source, digest, paths in pending:
+                record_payload(journal, name, source, lang, digest)
+                if lang != source_lang:
+                    record_translations(translated, lang, json.loads(paths), hashes)
+            save_journal(locale_dir, journal, txn)
+            save_sources(locale_dir, translated, txn)
+            save_manifest(locale_dir, manifest, txn)
+            txn.commit()
+        except BaseException:
+            txn.abort()
+            raise
+
+    with conn:
+        conn.execute(f"DELETE FROM pending_patches WHERE lang IN ({marks})", languages)
+        conn.executemany(
+            "UPDATE imports SET file_hash = ?, changed = 0 WHERE lang = ?",
+            [(digest, lang) for lang, digest in outputs.items()],
+        )
+    return written
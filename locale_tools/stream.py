@@ -0,0 +1,174 @@
+"""
+Streaming, bounded-memory locale reader.
+
+``iter_events`` walks a locale file as a sequence of ``(key_path, value)``
+events, one per leaf, reading the file in fixed-size chunks. Only the
+current chunk, the current key path and the value being decoded are held in
+memory, so coverage checks, placeholder validation and key lookups over very
+large catalogs run in constant memory instead of building the whole tree.
+List items are reported with their integer index in the path.
+"""
+
+import json
+import re
+from json.decoder import scanstring
+
+CHUNK_SIZE = 64 * 1024
+
+NUMBER_RE = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?")
+NUMBER_CONTINUES = ".eE+-0123456789"
+LITERALS = {"true": True, "false": False, "null": None}
+WHITESPACE = " \t\n\r"
+
+
+class StreamError(ValueError):
+    """Raised when a locale file is not valid JSON"""
+
+
+class _Lexer:
+    """Pulls JSON tokens out of a file one chunk at a time"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        """Drop consumed input and read the next chunk; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _skip_whitespace(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return
+
+    def next(self):
+        """Return the next token: a structural character or ('value', python value)"""
+        self._skip_whitespace()
+        if self.pos >= len(self.buf):
+            return None
+
+        char = self.buf[self.pos]
+        if char in "{}[]:,":
+            self.pos += 1
+            return char
+
+        if char == '"':
+            while True:
+                try:
+                    value, end = scanstring(self.buf, self.pos + 1)
+                except json.JSONDecodeError:
+                    if self._fill():
+                        continue
+                    raise StreamError("unterminated string") from None
+                self.pos = end
+                return ("value", value)
+
+        while True:
+            match = NUMBER_RE.match(self.buf, self.pos)
+            word = self.buf[self.pos:self.pos + 5]
+            # A number cut by the chunk boundary, e.g. "1." or "2e", matches short
+            # and is followed by what would continue it, or by the end of the buffer
+            cut = match and self.buf[match.end():match.end() + 1] in ("", *NUMBER_CONTINUES)
+            if (cut or len(word) < 5) and self._fill():
+                continue
+            break
+
+        if match:
+            self.pos = match.end()
+            text = match.group()
+            return ("value", float(text) if any(c in text for c in ".eE") else int(text))
+        for literal, value in LITERALS.items():
+            if self.buf.startswith(literal, self.pos):
+                self.pos += len(literal)
+                return ("value", value)
+        raise StreamError(f"unexpected {char!r}")
+
+
+def _expect(lexer, *allowed):
+    token = lexer.next()
+    if token not in allowed:
+        raise StreamError(f"expected {' or '.join(allowed)}, got {token!r}")
+    return token
+
+
+def _walk(lexer, token, path, containers):
+    """Yield events for the value starting at token"""
+    if token == "{":
+        if containers and path:
+            yield path, {}
+        token = lexer.next()
+        if token == "}":
+            return
+        while True:
+            if not isinstance(token, tuple) or not isinstance(token[1], str):
+                raise StreamError(f"expected a key at {'.'.join(map(str, path)) or '<root>'}")
+            _expect(lexer, ":")
+            yield from _walk(lexer, lexer.next(), path + (token[1],), containers)
+            if _expect(lexer, ",", "}") == "}":
+                return
+            token = lexer.next()
+    elif token == "[":
+        if containers:
+            yield path, []
+        token = lexer.next()
+        index = 0
+        if token == "]":
+            return
+        while True:
+            yield from _walk(lexer, token, path + (index,), containers)
+            index += 1
+            if _expect(lexer, ",", "]") == "]":
+                return
+            token = lexer.next()
+    elif isinstance(token, tuple):
+        yield path, token[1]
+    else:
+        raise StreamError(f"unexpected {token!r}")
+
+
+def iter_events(path, chunk_size=CHUNK_SIZE, containers=False):
+    """
+    Yield (key_path, value) for every leaf of a locale file. With containers,
+    sections and lists are also reported, as an empty {} or [] placeholder,
+    before their children.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        lexer = _Lexer(f, chunk_size)
+        token = lexer.next()
+        if token != "{":
+            raise StreamError(f"{path}: a locale must be a JSON object")
+        yield from _walk(lexer, token, (), containers)
+        if lexer.next() is not None:
+            raise StreamError(f"{path}: trailing data after the locale object")
+
+
+def stream_lookup(path, dot_path):
+    """Return the leaf at dot_path (or a list's items) without loading the tree"""
+    target = tuple(dot_path.split("."))
+    items = None
+    for key_path, value in iter_events(path, containers=True):
+        if key_path == target:
+            if not isinstance(value, list):
+                return value
+            items = []
+        elif items is not None:
+            if key_path[:-1] == target:
+                items.append(value)
+            else:
+                return items
+    if items is not None:
+        return items
+    raise KeyError(dot_path)
@@ -0,0 +1,118 @@
+"""
+Synthetic locale trees for benchmarks.
+
+Generated locales are shaped like en.json: a handful of nested namespaces,
+short UI labels, ``{{placeholder}}`` interpolations and an ``seo`` section
+with long descriptions. Output is deterministic for a given seed, so the
+same scenario produces the same bytes on every machine.
+"""
+
+import os
+import random
+import string
+
+from .engine import dump_locale
+
+NAMESPACES = (
+    "nav", "hero", "products", "footer", "reviews", "events", "rentPurchase",
+    "about", "contactPage", "vr", "useCases", "vr_page", "unifiedForm", "admin",
+    "proposal", "common", "paymentSuccess",
+)
+
+PLACEHOLDERS = ("{{count}}", "{{seconds}}", "{{name}}", "{{clientName}}", "{{date}}")
+
+WORDS = (
+    "simulator", "motion", "racing", "circuit", "rider", "event", "training",
+    "experience", "premium", "professional", "axis", "lean", "telemetry",
+    "immersion", "track", "speed", "brand", "proposal", "rental", "purchase",
+)
+
+
+def language_codes(count):
+    """Deterministic codes that look like base locale files: aa, ab, ..., then aaa"""
+    codes = []
+    letters = string.ascii_lowercase
+    for first in letters:
+        for second in letters:
+            codes.append(first + second)
+    for first in letters:
+        for second in letters:
+            for third in letters:
+                codes.append(first + second + third)
+    return codes[:count]
+
+
+def _sentence(rng, words):
+    text = " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+    if rng.random() < 0.2:
+        text += " " + rng.choice(PLACEHOLDERS)
+    return text + "."
+
+
+def _section(rng, depth, budget):
+    """A nested section of roughly budget bytes"""
+    section, size, i = {}, 0, 0
+    while size < budget:
+        key = f"{rng.choice(WORDS)}{i}"
+        if depth > 0 and rng.random() < 0.15:
+            child_budget = min(budget - size, rng.randint(200, 2000))
+            section[key] = _section(rng, depth - 1, child_budget)
+            size += child_budget
+        else:
+            section[key] = _sentence(rng, rng.randint(2, 14))
+            size += len(key) + len(section[key]) + 8
+        i += 1
+    return section
+
+
+def _seo(rng):
+    pages = ("site", "home", "simulators", "reviews", "events", "about", "contact", "vr")
+    return {
+        page: {
+            "title": _sentence(rng, 8),
+            "description": " ".join(_sentence(rng, 20) for _ in range(3)),
+            "keywords": ", ".join(rng.choice(WORDS) for _ in range(10)),
+        }
+        for page in pages
+    }
+
+
+def generate_locale(target_bytes, seed=0):
+    """A locale tree of roughly target_bytes when serialized with dump_locale"""
+    rng = random.Random(seed)
+    data = {"seo": _seo(rng)}
+    per_namespace = max(200, target_bytes // len(NAMESPACES))
+    round_ = 0
+    while len(dump_locale(data)) < target_bytes:
+        for namespace in NAMESPACES:
+            name = namespace if round_ == 0 else f"{namespace}{round_}"
+            data[name] = _section(rng, 3, per_namespace)
+        round_ += 1
+    return data
+
+
+def generate_patch(data, fraction=0.05, seed=0):
+    """(path, value) operations rewriting about fraction of the leaves plus the seo section"""
+    rng = random.Random(seed)
+    ops = [(("seo",), _seo(rng))]
+    stack = [((), data)]
+    while stack:
+        path, node = stack.pop()
+        for key, value in node.items():
+            if isinstance(value, dict):
+                stack.append((path + (key,), value))
+            elif rng.random() < fraction:
+                ops.append((path + (key,), _sentence(rng, 6)))
+    return ops
+
+
+def write_tree(out_dir, languages, target_bytes, seed=0):
+    """Write one synthetic locale per language code; returns the codes"""
+    os.makedirs(out_dir, exist_ok=True)
+    codes = language_codes(languages)
+    base = generate_locale(target_bytes, seed)
+    text = dump_locale(base)
+    for code in codes:
+        with open(os.path.join(out_dir, f"{code}.json"), "w", encoding="utf-8") as f:
+            f.write(text)
+    return codes, base
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from locale_tools import cache
+
+
+@pytest.fixture(autouse=True)
+def no_parse_cache(monkeypatch):
+    """Keep tests from reading or writing the shared parsed-locale cache"""
+    monkeypatch.setattr(cache, "_enabled", False)
+
+
+def write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+@pytest.fixture
+def site(tmp_path):
+    """A two-language locale directory with one patch set"""
+    locale_dir = tmp_path / "locales"
+    patch_dir = tmp_path / "patches"
+    write_json(locale_dir / "en.json", {
+        "nav": {"home": "Home", "contact": "Contact"},
+        "hero": {"title": "Hello {{name}}", "cta": "Book now"},
+    })
+    write_json(locale_dir / "fr.json", {
+        "nav": {"home": "Accueil"},
+        "hero": {"title": "Bonjour {{name}}"},
+    })
+    write_json(patch_dir / "missing_keys" / "fr.json", {"nav": {"contact": "Contact"}})
+    return locale_dir, patch_dir
@@ -0,0 +1,55 @@
+import gzip
+import json
+
+import pytest
+
+from locale_tools.artifacts import ARTIFACT_MANIFEST_NAME, build_artifacts
+
+
+def _files(directory):
+    return sorted(str(path.relative_to(directory)) for path in directory.rglob("*") if path.is_file())
+
+
+def test_build_writes_hashed_compressed_artifacts(site, tmp_path):
+    locale_dir, _ = site
+    out = tmp_path / "i18n"
+    manifest, changed = build_artifacts(str(locale_dir), str(out), use_brotli=False)
+
+    entry = manifest["languages"]["fr"]
+    name = entry["url"].rsplit("/", 1)[1]
+    raw = (out / name).read_bytes()
+    assert json.loads(raw) == json.loads((locale_dir / "fr.json").read_text(encoding="utf-8"))
+    assert gzip.decompress((out / f"{name}.gz").read_bytes()) == raw
+    assert entry["bytes"] == len(raw)
+    assert changed == 5
+
+    assert build_artifacts(str(locale_dir), str(out), use_brotli=False)[1] == 0
+
+
+def test_rebuild_removes_only_stale_artifacts(site, tmp_path):
+    locale_dir, _ = site
+    out = tmp_path / "i18n"
+    build_artifacts(str(locale_dir), str(out), use_brotli=False)
+    (out / "robots.txt").write_text("User-agent: *", encoding="utf-8")
+    (out / "img").mkdir()
+    (out / "img" / "logo.png").write_bytes(b"png")
+    before = set(_files(out))
+
+    (locale_dir / "fr.json").write_text(json.dumps({"nav": {"home": "Début"}}), encoding="utf-8")
+    manifest, _ = build_artifacts(str(locale_dir), str(out), use_brotli=False)
+
+    after = set(_files(out))
+    assert {"robots.txt", "img/logo.png", ARTIFACT_MANIFEST_NAME} <= after
+    removed = before - after
+    assert len(removed) == 2 and all(name.startswith("fr.") for name in removed)
+    assert manifest["languages"]["fr"]["url"].rsplit("/", 1)[1] in after
+
+
+def test_refuses_a_foreign_non_empty_directory(site, tmp_path):
+    locale_dir, _ = site
+    out = tmp_path / "public"
+    out.mkdir()
+    (out / "robots.txt").write_text("User-agent: *", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        build_artifacts(str(locale_dir), str(out), use_brotli=False)
+    assert _files(out) == ["robots.txt"]
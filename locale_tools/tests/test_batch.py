@@ -0,0 +1,49 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from locale_tools.batch import SiteResult, site_dirs, sync_sites
+from locale_tools.config import LOCALE_SUBDIR
+
+
+def make_site(root, fr_home):
+    locale_dir, patch_dir = site_dirs(str(root))
+    files = {
+        f"{locale_dir}/en.json": {"nav": {"home": "Home", "contact": "Contact"}},
+        f"{locale_dir}/fr.json": {"nav": {"home": fr_home}},
+        f"{patch_dir}/missing_keys/fr.json": {"nav": {"contact": "Contact"}},
+    }
+    for path, data in files.items():
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    return root
+
+
+@pytest.mark.parametrize("parallel", [1, 2])
+def test_sites_sync_independently_in_root_order(tmp_path, parallel):
+    roots = [make_site(tmp_path / "b", "Accueil"), tmp_path / "missing", make_site(tmp_path / "a", "Début")]
+    results = sync_sites([str(root) for root in roots], parallel)
+
+    assert [result.root for result in results] == [str(root) for root in roots]
+    assert all(isinstance(result, SiteResult) for result in results)
+    first, missing, last = results
+    assert first.written == ["fr"] and last.written == ["fr"] and not first.failed
+    assert "fr.json" in first.output
+    assert missing.failed and "no locale directory" in missing.error
+    assert json.loads((tmp_path / "a" / LOCALE_SUBDIR / "fr.json").read_text(encoding="utf-8")) == {
+        "nav": {"home": "Début", "contact": "Contact"},
+    }
+
+    again = sync_sites([str(tmp_path / "a")], parallel)
+    assert again[0].up_to_date and again[0].written == []
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    root = make_site(tmp_path / "site", "Accueil")
+    fr = root / LOCALE_SUBDIR / "fr.json"
+    before = fr.read_text(encoding="utf-8")
+    [result] = sync_sites([str(root)], dry_run=True)
+    assert not result.failed
+    assert fr.read_text(encoding="utf-8") == before
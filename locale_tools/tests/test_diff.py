@@ -0,0 +1,72 @@
+import copy
+import json
+
+import pytest
+
+from locale_tools.diff import diff, pointer, summarize
+from locale_tools.engine import sync
+from locale_tools.transaction import TMP_SUFFIX, TXN_NAME
+
+
+def _unescape(token):
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def apply_patch(document, ops):
+    """Minimal RFC 6902 add/remove/replace, enough to check diff output"""
+    document = copy.deepcopy(document)
+    for op in ops:
+        tokens = [_unescape(token) for token in op["path"].split("/")[1:]]
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        key = int(tokens[-1]) if isinstance(parent, list) else tokens[-1]
+        if op["op"] == "remove":
+            del parent[key]
+        elif op["op"] == "replace" and not tokens:
+            document = op["value"]
+        else:
+            parent[key] = op["value"]
+    return document
+
+
+CASES = [
+    ({"a": "x"}, {"a": "x"}),
+    ({"a": "x"}, {"a": "y"}),
+    ({"a": {"b": "x", "c": "y"}}, {"a": {"b": "x"}, "d": "z"}),
+    ({"a": "x"}, {"a": {"b": "x"}}),
+    ({"list": ["a", "b"]}, {"list": ["a", "c"]}),
+    ({"list": ["a", "b"]}, {"list": ["a"]}),
+    ({"odd/key": "x", "til~de": "y"}, {"odd/key": "z"}),
+]
+
+
+@pytest.mark.parametrize("old, new", CASES)
+def test_round_trip(old, new):
+    ops = json.loads(json.dumps(diff(old, new)))
+    assert apply_patch(old, ops) == new
+
+
+def test_no_changes_is_empty():
+    assert diff({"a": {"b": ["c"]}}, {"a": {"b": ["c"]}}) == []
+
+
+def test_pointer_escaping():
+    assert pointer(("a/b", "c~d", 0)) == "/a~1b/c~0d/0"
+
+
+def test_summarize():
+    ops = diff({"a": "x", "b": "y"}, {"a": "z", "c": "w"})
+    assert summarize(ops) == {"replace": 1, "remove": 1, "add": 1}
+
+
+def test_dry_run_leaves_an_interrupted_commit_alone(site):
+    locale_dir, patch_dir = site
+    tmp = locale_dir / f"en.json.1{TMP_SUFFIX}"
+    tmp.write_text("{}", encoding="utf-8")
+    (locale_dir / TXN_NAME).write_text(json.dumps([[str(tmp), str(locale_dir / "en.json")]]), encoding="utf-8")
+    before = {path.name: path.read_bytes() for path in locale_dir.iterdir()}
+
+    report = sync(str(locale_dir), patch_dir=str(patch_dir), dry_run=True)
+    assert summarize(report.patches["fr"]) == {"add": 1}
+    assert {path.name: path.read_bytes() for path in locale_dir.iterdir() if path.name != ".locale-tools.lock"} == before
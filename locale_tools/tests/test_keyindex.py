@@ -0,0 +1,40 @@
+import pytest
+
+from locale_tools.keyindex import KeyIndex
+
+
+@pytest.fixture
+def index():
+    index = KeyIndex()
+    index.add("en", {"seo": {"home": {"title": "Home", "desc": "Welcome"}, "blog": {"title": "Blog"}}, "nav": {"items": ["a", "b"]}})
+    index.add("fr", {"seo": {"home": {"title": "Accueil"}}, "nav": {"items": None}})
+    return index
+
+
+def test_exact_path_and_single_segment_wildcard(index):
+    assert index.query("seo.home.title") == {"seo.home.title": ["en", "fr"]}
+    assert index.query("seo.*") == {"seo.blog": ["en"], "seo.home": ["en", "fr"]}
+    assert index.query("seo.*.title") == {"seo.blog.title": ["en"], "seo.home.title": ["en", "fr"]}
+    assert index.query("seo.missing") == {}
+
+
+def test_trailing_double_star_matches_everything_underneath(index):
+    assert list(index.query("seo.**")) == ["seo.blog", "seo.blog.title", "seo.home", "seo.home.desc", "seo.home.title"]
+
+
+def test_double_star_is_only_allowed_last(index):
+    with pytest.raises(ValueError):
+        index.query("**.title")
+
+
+def test_language_mask(index):
+    assert index.query("seo.*.*", ["fr"]) == {"seo.home.title": ["fr"]}
+    with pytest.raises(ValueError, match="de is not indexed"):
+        index.mask(["de"])
+    with pytest.raises(ValueError):
+        index.add("fr", {})
+
+
+def test_kinds_and_flat(index):
+    assert index.flat("en")["nav.items"] == "array"
+    assert index.flat("fr") == {"seo": "object", "seo.home": "object", "seo.home.title": "string", "nav": "object", "nav.items": "null"}
@@ -0,0 +1,49 @@
+import pytest
+
+from locale_tools.merge import MergeConflict, deep_merge
+
+
+def _trees():
+    target = {"nav": {"home": "Home", "about": "About"}, "footer": "Old"}
+    patch = {"nav": {"home": "Start", "vr": "VR"}, "footer": "Old"}
+    return target, patch
+
+
+def test_patch_wins():
+    target, patch = _trees()
+    stats = deep_merge(target, patch, "patch-wins")
+    assert target == {"nav": {"home": "Start", "about": "About", "vr": "VR"}, "footer": "Old"}
+    assert stats.added == ["nav.vr"]
+    assert stats.overwritten == ["nav.home"]
+    assert sorted(stats.preserved) == ["footer", "nav.about"]
+
+
+def test_file_wins():
+    target, patch = _trees()
+    stats = deep_merge(target, patch, "file-wins")
+    assert target == {"nav": {"home": "Home", "about": "About", "vr": "VR"}, "footer": "Old"}
+    assert stats.kept == ["nav.home"]
+    assert stats.added == ["nav.vr"]
+
+
+def test_fail():
+    target, patch = _trees()
+    with pytest.raises(MergeConflict):
+        deep_merge(target, patch, "fail")
+
+
+def test_fail_without_conflicts():
+    target = {"nav": {"home": "Home"}}
+    deep_merge(target, {"nav": {"home": "Home", "vr": "VR"}}, "fail")
+    assert target == {"nav": {"home": "Home", "vr": "VR"}}
+
+
+def test_section_replaces_leaf():
+    target = {"seo": "todo"}
+    deep_merge(target, {"seo": {"title": "Title"}})
+    assert target == {"seo": {"title": "Title"}}
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        deep_merge({}, {}, "theirs")
@@ -0,0 +1,20 @@
+from locale_tools.placeholders import compare_placeholders, describe, extract_from_events, extract_placeholders
+
+
+def test_extract_handles_formats_and_lists():
+    data = {"hero": {"title": "Hi {{ name }}, {{count, number}} laps"}, "steps": ["Go {{where}}", "Done"]}
+    assert extract_placeholders(data) == {
+        "hero.title": {"name", "count"},
+        "steps.0": {"where"},
+        "steps.1": set(),
+    }
+    assert extract_from_events([(("hero", "title"), "{{name}}"), (("hero", "laps"), 3)]) == {"hero.title": {"name"}}
+
+
+def test_compare_only_reports_shared_keys_that_differ():
+    source = extract_placeholders({"a": "{{name}} {{date}}", "b": "{{x}}", "c": "{{only}}"})
+    target = extract_placeholders({"a": "{{nom}} {{date}}", "b": "{{x}}"})
+    mismatches = compare_placeholders(source, target)
+    assert mismatches == {"a": {"missing": ["name"], "unexpected": ["nom"]}}
+    assert describe("a", mismatches["a"]) == "a: missing {{name}}; unexpected {{nom}}"
+    assert describe("b", {"missing": ["x"], "unexpected": []}) == "b: missing {{x}}"
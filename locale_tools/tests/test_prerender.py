@@ -0,0 +1,67 @@
+import json
+
+from locale_tools.prerender import ROUTES, head_tags, render_page, update_vercel_config, vercel_rewrites
+
+TEMPLATE = """<!doctype html>
+<html lang="es">
+  <head>
+    <meta charset="UTF-8" />
+    <title>Devotion</title>
+    <meta name="description" content="Simuladores" />
+    <link rel="canonical" href="https://devotionsim.com/" />
+    <link rel="alternate" hreflang="en" href="https://devotionsim.com/?lang=en" />
+    <meta property="og:title" content="Devotion" />
+    <meta property="og:locale" content="es_ES" />
+    <meta property="og:image" content="/og.png" />
+  </head>
+  <body><div id="root"></div></body>
+</html>
+"""
+
+FALLBACK = {"site": {"name": "Devotion", "defaultDescription": "Racing simulators"}, "about": {"title": "About us"}}
+
+
+def test_head_tags_fall_back_to_the_source_language():
+    tags = head_tags("fr", "/about", {"about": {"title": "À propos & plus"}}, FALLBACK, ["en", "fr"])
+    assert tags[0] == "<title>À propos &amp; plus</title>"
+    assert '<meta name="description" content="Racing simulators" />' in tags
+    assert '<link rel="canonical" href="https://devotionsim.com/about" />' in tags
+    assert '<link rel="alternate" hreflang="en" href="https://devotionsim.com/about?lang=en" />' in tags
+    assert '<meta property="og:locale" content="fr_FR" />' in tags
+    assert '<meta property="og:locale:alternate" content="en_GB" />' in tags
+    assert not any("keywords" in tag for tag in tags)
+
+
+def test_render_page_replaces_the_template_tags():
+    tags = head_tags("fr", "/", {}, FALLBACK, ["en", "fr"])
+    page = render_page(TEMPLATE, "fr", tags)
+
+    assert '<html lang="fr">' in page and '<html lang="es">' not in page
+    assert page.count("<title>") == 1 and "<title>Devotion</title>" in page
+    assert "Simuladores" not in page and "es_ES" not in page
+    assert page.count('rel="canonical"') == 1
+    assert '<meta charset="UTF-8" />' in page and 'og:image' in page
+    assert page.index(tags[-1]) < page.index("</head>")
+
+
+def test_vercel_rewrites_cover_every_route():
+    rewrites = vercel_rewrites(["en", "fr"], "es")
+    assert len(rewrites) == 2 * len(ROUTES)
+    assert rewrites[:2] == [
+        {"source": "/", "has": [{"type": "query", "key": "lang", "value": "(?<lang>en|fr)"}], "destination": "/seo/:lang/index.html"},
+        {"source": "/", "destination": "/seo/es/index.html"},
+    ]
+
+
+def test_update_vercel_config_keeps_other_rewrites(site, tmp_path):
+    locale_dir, _ = site
+    path = tmp_path / "vercel.json"
+    spa = {"source": "/(.*)", "destination": "/index.html"}
+    path.write_text(json.dumps({"cleanUrls": True, "rewrites": [{"source": "/", "destination": "/seo/es/old.html"}, spa]}), encoding="utf-8")
+
+    assert update_vercel_config(str(path), str(locale_dir), write=False)
+    assert "old.html" in path.read_text(encoding="utf-8")
+    assert update_vercel_config(str(path), str(locale_dir))
+    config = json.loads(path.read_text(encoding="utf-8"))
+    assert config["cleanUrls"] and config["rewrites"] == vercel_rewrites(["en", "fr"]) + [spa]
+    assert not update_vercel_config(str(path), str(locale_dir))
@@ -0,0 +1,33 @@
+import json
+
+from locale_tools.split import SPLIT_MANIFEST_NAME, split_all, split_language
+
+
+def test_split_skips_unchanged_chunks_and_removes_stale_ones(tmp_path, capsys):
+    out = tmp_path / "ns"
+    entries, rewritten = split_language("en", out_dir=str(out), data={"nav": {"home": "Home"}, "hero": {"title": "Hi"}})
+    assert sorted(rewritten) == ["hero", "nav"]
+    assert entries["nav"]["path"] == "en/nav.json"
+    assert json.loads((out / "en" / "nav.json").read_text(encoding="utf-8")) == {"home": "Home"}
+
+    (out / "en" / "notes.txt").write_text("keep", encoding="utf-8")
+    entries, rewritten = split_language("en", out_dir=str(out), data={"nav": {"home": "Home"}, "hero": {"title": "Hello"}})
+    assert rewritten == ["hero"]
+
+    entries, rewritten = split_language("en", out_dir=str(out), data={"nav": {"home": "Home"}})
+    assert rewritten == [] and list(entries) == ["nav"]
+    assert sorted(path.name for path in (out / "en").iterdir()) == ["nav.json", "notes.txt"]
+    assert "Removed stale chunk en/hero.json" in capsys.readouterr().out
+
+
+def test_split_all_updates_one_language_in_the_manifest(site, tmp_path):
+    locale_dir, _ = site
+    out = tmp_path / "ns"
+    manifest, _ = split_all(str(locale_dir), str(out))
+    assert sorted(manifest["languages"]) == ["en", "fr"]
+
+    (locale_dir / "fr.json").write_text(json.dumps({"nav": {"home": "Début"}}), encoding="utf-8")
+    manifest, written = split_all(str(locale_dir), str(out), ["fr"])
+    assert written == 2
+    assert sorted(manifest["languages"]) == ["en", "fr"] and list(manifest["languages"]["fr"]) == ["nav"]
+    assert json.loads((out / SPLIT_MANIFEST_NAME).read_text(encoding="utf-8")) == manifest
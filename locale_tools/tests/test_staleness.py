@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from locale_tools.staleness import (
+    SOURCES_NAME, baseline, load_sources, record_translations, save_sources, stale_keys, string_hashes,
+)
+
+EN = {"nav": {"home": "Home", "contact": "Contact"}, "hero": {"title": "Hello {{name}}"}}
+
+
+def test_only_changed_source_strings_are_stale():
+    sources = load_sources("/nonexistent")
+    hashes = string_hashes(EN)
+    record_translations(sources, "fr", ["nav.home", "hero.title", "gone.key"], hashes)
+    assert set(sources["languages"]["fr"]) == {"nav.home", "hero.title"}
+    assert stale_keys(sources, hashes) == {}
+
+    edited = string_hashes({**EN, "hero": {"title": "Hi {{name}}"}})
+    assert stale_keys(sources, edited) == {"fr": ["hero.title"]}
+    assert stale_keys(sources, edited, ["de"]) == {}
+
+
+def test_baseline_only_records_untracked_keys():
+    sources = load_sources("/nonexistent")
+    old = string_hashes({"nav": {"home": "Start"}})
+    record_translations(sources, "fr", ["nav.home"], old)
+
+    hashes = string_hashes(EN)
+    assert baseline(sources, "fr", {"nav": {"home": "Accueil", "contact": "Contact"}, "extra": "x"}, hashes) == 1
+    assert stale_keys(sources, hashes) == {"fr": ["nav.home"]}
+
+
+def test_record_round_trips_and_rejects_other_versions(tmp_path):
+    sources = load_sources(str(tmp_path))
+    record_translations(sources, "fr", ["nav.home"], string_hashes(EN))
+    save_sources(str(tmp_path), sources)
+    assert load_sources(str(tmp_path)) == sources
+
+    (tmp_path / SOURCES_NAME).write_text(json.dumps({"version": 99}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_sources(str(tmp_path))
@@ -0,0 +1,89 @@
+import json
+import shutil
+
+import pytest
+
+from locale_tools import store
+from locale_tools.config import LOCALE_DIR
+from locale_tools.engine import discover_languages, dump_locale, locale_path, sync
+from locale_tools.journal import load_journal
+from locale_tools.patches import discover_patch_sets
+
+
+@pytest.fixture
+def real_locales(tmp_path):
+    """A copy of the repository's locales"""
+    locale_dir = tmp_path / "locales"
+    locale_dir.mkdir()
+    for lang in discover_languages(LOCALE_DIR):
+        shutil.copy(locale_path(lang, LOCALE_DIR), locale_dir)
+    return locale_dir
+
+
+def test_round_trip_is_byte_identical(real_locales, tmp_path):
+    originals = {path.name: path.read_bytes() for path in real_locales.glob("[a-z]*.json")}
+    conn = store.connect(str(tmp_path / "store.sqlite3"))
+    store.import_locales(conn, str(real_locales))
+    assert store.export_locales(conn, str(real_locales), patch_dir=str(tmp_path / "patches")) == []
+    assert {path.name: path.read_bytes() for path in real_locales.glob("[a-z]*.json")} == originals
+
+
+def test_set_value_exports_like_dump_locale(site, tmp_path):
+    locale_dir, patch_dir = site
+    conn = store.connect(str(tmp_path / "store.sqlite3"))
+    store.import_locales(conn, str(locale_dir))
+    store.set_value(conn, "fr", "nav.about", "À propos")
+    store.set_value(conn, "fr", "hero", {"title": "Salut {{name}}", "cta": "Réserver"})
+
+    assert store.lookup(conn, "fr", "nav") == {"home": "Accueil", "about": "À propos"}
+    assert store.export_locales(conn, str(locale_dir), patch_dir=str(patch_dir)) == ["fr"]
+    expected = {"nav": {"home": "Accueil", "about": "À propos"}, "hero": {"title": "Salut {{name}}", "cta": "Réserver"}}
+    assert (locale_dir / "fr.json").read_text(encoding="utf-8") == dump_locale(expected)
+
+
+def test_patches_honour_the_journal(site, tmp_path):
+    locale_dir, patch_dir = site
+    sync(str(locale_dir), patch_dir=str(patch_dir))
+    fr = json.loads((locale_dir / "fr.json").read_text(encoding="utf-8"))
+    fr["nav"]["contact"] = "Nous contacter"
+    (locale_dir / "fr.json").write_text(dump_locale(fr), encoding="utf-8")
+
+    conn = store.connect(str(tmp_path / "store.sqlite3"))
+    store.import_locales(conn, str(locale_dir))
+    patch_sets = discover_patch_sets(str(patch_dir), str(locale_dir))
+    assert store.import_patch_sets(conn, patch_sets, journal=load_journal(str(locale_dir))) == {}
+    assert store.export_locales(conn, str(locale_dir), patch_dir=str(patch_dir)) == []
+    assert json.loads((locale_dir / "fr.json").read_text(encoding="utf-8"))["nav"]["contact"] == "Nous contacter"
+
+
+def test_export_refuses_locales_changed_since_import(site, tmp_path):
+    locale_dir, patch_dir = site
+    conn = store.connect(str(tmp_path / "store.sqlite3"))
+    store.import_locales(conn, str(locale_dir))
+    # A sync applies a new patch set to fr after the import
+    sync(str(locale_dir), patch_dir=str(patch_dir))
+    synced = (locale_dir / "fr.json").read_bytes()
+
+    store.set_value(conn, "en", "nav.home", "Start")
+    store.set_value(conn, "fr", "nav.home", "Début")
+    with pytest.raises(store.StoreConflict):
+        store.export_locales(conn, str(locale_dir), patch_dir=str(patch_dir))
+    assert (locale_dir / "fr.json").read_bytes() == synced
+    assert json.loads((locale_dir / "en.json").read_text(encoding="utf-8"))["nav"]["home"] == "Home"
+
+    # Languages not edited in the store are never exported
+    assert store.export_locales(conn, str(locale_dir), ["en"], patch_dir=str(patch_dir)) == ["en"]
+    assert (locale_dir / "fr.json").read_bytes() == synced
+
+
+def test_export_records_pending_patches(site, tmp_path):
+    locale_dir, patch_dir = site
+    conn = store.connect(str(tmp_path / "store.sqlite3"))
+    store.import_locales(conn, str(locale_dir))
+    patch_sets = discover_patch_sets(str(patch_dir), str(locale_dir))
+    assert store.import_patch_sets(conn, patch_sets, journal=load_journal(str(locale_dir))) == {"fr": 1}
+    assert store.export_locales(conn, str(locale_dir), patch_dir=str(patch_dir)) == ["fr"]
+
+    assert "fr" in load_journal(str(locale_dir))["applied"]["missing_keys"]["languages"]
+    report = sync(str(locale_dir), patch_dir=str(patch_dir))
+    assert report.applied == [] and report.written == []
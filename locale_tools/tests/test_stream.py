@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from locale_tools.stream import StreamError, iter_events, stream_lookup
+
+DOCUMENT = {
+    "a": -35000000000.0,
+    "b": 1,
+    "nav": {"home": "Inicio", "quote": "\"x\" \\ é", "empty": {}},
+    "numbers": [0, -0.5, 1e5, 2.5E-3, 12, 3.25e+2],
+    "flags": [True, False, None],
+    "list": ["one", "two"],
+}
+
+
+def _expected(data, prefix=()):
+    for key, value in data.items() if isinstance(data, dict) else enumerate(data):
+        path = prefix + (key,)
+        if isinstance(value, (dict, list)) and value:
+            yield from _expected(value, path)
+        elif not isinstance(value, (dict, list)):
+            yield path, value
+
+
+@pytest.fixture
+def locale_file(tmp_path):
+    path = tmp_path / "en.json"
+    path.write_text(json.dumps(DOCUMENT, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64, 65536])
+def test_events_match_json_loads(locale_file, chunk_size):
+    loaded = json.loads(locale_file.read_text(encoding="utf-8"))
+    assert list(iter_events(locale_file, chunk_size)) == list(_expected(loaded))
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 12))
+def test_float_split_by_chunk_boundary(tmp_path, chunk_size):
+    path = tmp_path / "en.json"
+    path.write_text('{"a": -35000000000.0, "b": 1, "c": 2e-3}', encoding="utf-8")
+    assert dict(iter_events(path, chunk_size)) == {("a",): -35000000000.0, ("b",): 1, ("c",): 2e-3}
+
+
+def test_lookup(locale_file):
+    assert stream_lookup(locale_file, "nav.home") == "Inicio"
+    assert stream_lookup(locale_file, "list") == ["one", "two"]
+    with pytest.raises(KeyError):
+        stream_lookup(locale_file, "nav.missing")
+
+
+@pytest.mark.parametrize("text", ['{"a": 1.}', '{"a": "open', '{"a": 1} 2', '["a"]'])
+def test_invalid_json(tmp_path, text):
+    path = tmp_path / "en.json"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(StreamError):
+        list(iter_events(path, 1))
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from locale_tools import engine
+from locale_tools.engine import dump_locale, sync
+from locale_tools.journal import JOURNAL_VERSION, journal_path, load_journal
+from locale_tools.manifest import ops_hash
+from locale_tools.patches import LazyOps
+
+
+def _forbid(monkeypatch, target, name):
+    def fail(*args, **kwargs):
+        pytest.fail(f"{name} was called")
+    monkeypatch.setattr(target, name, fail)
+
+
+def test_applies_pending_patches(site):
+    locale_dir, patch_dir = site
+    report = sync(str(locale_dir), patch_dir=str(patch_dir))
+    assert report.written == ["fr"]
+    assert report.applied == ["missing_keys"]
+    fr = json.loads((locale_dir / "fr.json").read_text(encoding="utf-8"))
+    assert fr["nav"] == {"home": "Accueil", "contact": "Contact"}
+
+
+def test_unchanged_inputs_parse_nothing(site, monkeypatch):
+    locale_dir, patch_dir = site
+    sync(str(locale_dir), patch_dir=str(patch_dir))
+    sync(str(locale_dir), patch_dir=str(patch_dir))
+
+    _forbid(monkeypatch, engine, "load_locale")
+    _forbid(monkeypatch, engine, "discover_patch_sets")
+    for _ in range(2):
+        assert sync(str(locale_dir), patch_dir=str(patch_dir)).up_to_date
+
+
+def test_hand_edits_survive_and_keep_the_fast_path(site, monkeypatch):
+    locale_dir, patch_dir = site
+    sync(str(locale_dir), patch_dir=str(patch_dir))
+    fr = json.loads((locale_dir / "fr.json").read_text(encoding="utf-8"))
+    fr["nav"]["contact"] = "Nous contacter"
+    (locale_dir / "fr.json").write_text(dump_locale(fr), encoding="utf-8")
+
+    # Applied payloads are recognised by their file hash, without parsing them
+    _forbid(monkeypatch, LazyOps, "__getitem__")
+    _forbid(monkeypatch, engine, "load_locale")
+    report = sync(str(locale_dir), patch_dir=str(patch_dir))
+    assert not report.up_to_date and report.written == []
+    assert sync(str(locale_dir), patch_dir=str(patch_dir)).up_to_date
+    assert json.loads((locale_dir / "fr.json").read_text(encoding="utf-8"))["nav"]["contact"] == "Nous contacter"
+
+
+def test_changed_payload_runs_again(site):
+    locale_dir, patch_dir = site
+    sync(str(locale_dir), patch_dir=str(patch_dir))
+    (patch_dir / "missing_keys" / "fr.json").write_text(json.dumps({"nav": {"contact": "Contactez-nous"}}))
+    report = sync(str(locale_dir), patch_dir=str(patch_dir))
+    assert report.applied == ["missing_keys"]
+    assert json.loads((locale_dir / "fr.json").read_text(encoding="utf-8"))["nav"]["contact"] == "Contactez-nous"
+
+
+def test_version_1_journal_is_upgraded(site):
+    locale_dir, patch_dir = site
+    ops = [(("nav",), {"contact": "Contact"})]
+    legacy = {
+        "version": 1,
+        "applied": {"missing_keys": {"source": "patches/missing_keys", "appliedAt": "", "languages": {"fr": ops_hash(ops)}}},
+    }
+    (locale_dir / "fr.json").write_text(dump_locale({"nav": {"home": "Accueil", "contact": "Nous contacter"}}))
+    with open(journal_path(str(locale_dir)), "w", encoding="utf-8") as f:
+        json.dump(legacy, f)
+
+    report = sync(str(locale_dir), patch_dir=str(patch_dir))
+    assert report.applied == []
+    assert load_journal(str(locale_dir))["version"] == JOURNAL_VERSION
+    assert json.loads((locale_dir / "fr.json").read_text(encoding="utf-8"))["nav"]["contact"] == "Nous contacter"
+
+
+def test_invalid_locale_writes_nothing(site):
+    locale_dir, patch_dir = site
+    (patch_dir / "missing_keys" / "fr.json").write_text(json.dumps({"nav": {"contact": 3}}))
+    before = (locale_dir / "fr.json").read_bytes()
+    report = sync(str(locale_dir), patch_dir=str(patch_dir))
+    assert "fr" in report.invalid
+    assert (locale_dir / "fr.json").read_bytes() == before
+
+
+def test_payload_without_base_locale_is_skipped(site, capsys):
+    locale_dir, patch_dir = site
+    (patch_dir / "extra").mkdir()
+    (patch_dir / "extra" / "sv.json").write_text(json.dumps({"nav": {"home": "Hem"}}))
+    report = sync(str(locale_dir), patch_dir=str(patch_dir))
+    assert report.written == ["fr"] and not report.invalid
+    assert "sv.json locale to patch, skipped" in capsys.readouterr().out
+    assert not (locale_dir / "sv.json").exists()
+
+
+def test_moving_the_tree_keeps_the_fast_path(site, tmp_path):
+    locale_dir, patch_dir = site
+    sync(str(locale_dir), patch_dir=str(patch_dir))
+    sync(str(locale_dir), patch_dir=str(patch_dir))
+    moved = tmp_path.parent / f"{tmp_path.name}-moved"
+    tmp_path.rename(moved)
+    assert sync(str(moved / "locales"), patch_dir=str(moved / "patches")).up_to_date
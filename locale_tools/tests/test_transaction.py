@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from locale_tools.transaction import TMP_SUFFIX, TXN_NAME, Transaction, recover
+
+
+@pytest.fixture
+def targets(tmp_path):
+    paths = [tmp_path / "en.json", tmp_path / "fr.json"]
+    for path in paths:
+        path.write_text("old", encoding="utf-8")
+    return paths
+
+
+def _leftovers(directory):
+    return [name for name in os.listdir(directory) if name.endswith(TMP_SUFFIX) or name == TXN_NAME]
+
+
+def test_commit(targets, tmp_path):
+    txn = Transaction(str(tmp_path))
+    for path in targets:
+        txn.stage(str(path), "new")
+    txn.commit()
+    assert [path.read_text(encoding="utf-8") for path in targets] == ["new", "new"]
+    assert _leftovers(tmp_path) == []
+
+
+def test_abort_leaves_targets_untouched(targets, tmp_path):
+    txn = Transaction(str(tmp_path))
+    for path in targets:
+        txn.stage(str(path), "new")
+    txn.abort()
+    assert [path.read_text(encoding="utf-8") for path in targets] == ["old", "old"]
+    assert _leftovers(tmp_path) == []
+
+
+def test_stage_stream_skips_identical_output(targets, tmp_path):
+    txn = Transaction(str(tmp_path))
+    assert not txn.stage_stream(str(targets[0]), lambda f: f.write("old"))
+    assert txn.stage_stream(str(targets[1]), lambda f: f.write("new"))
+    txn.commit()
+    assert [path.read_text(encoding="utf-8") for path in targets] == ["old", "new"]
+
+
+def test_recover_rolls_an_interrupted_commit_forward(targets, tmp_path, monkeypatch):
+    txn = Transaction(str(tmp_path))
+    for path in targets:
+        txn.stage(str(path), "new")
+
+    replace = os.replace
+    calls = []
+
+    def crash_on_second_target(src, dst):
+        calls.append(dst)
+        # The commit record is renamed first, then each target
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", crash_on_second_target)
+    with pytest.raises(KeyboardInterrupt):
+        txn.commit()
+    monkeypatch.setattr(os, "replace", replace)
+    assert [path.read_text(encoding="utf-8") for path in targets] == ["new", "old"]
+
+    assert recover(str(tmp_path)) == [str(targets[1])]
+    assert [path.read_text(encoding="utf-8") for path in targets] == ["new", "new"]
+    assert _leftovers(tmp_path) == []
+
+
+def test_recover_drops_orphaned_temp_files(targets, tmp_path):
+    Transaction(str(tmp_path)).stage(str(targets[0]), "new")
+    assert recover(str(tmp_path)) == []
+    assert targets[0].read_text(encoding="utf-8") == "old"
+    assert _leftovers(tmp_path) == []
@@ -0,0 +1,34 @@
+import json
+
+from locale_tools.translate import PATCH_SET_NAME, StubProvider, TranslationCache, fill_missing
+
+
+def test_fill_missing_uses_the_cache_on_rerun(site, tmp_path):
+    locale_dir, patch_dir = site
+    cache_dir = tmp_path / "cache"
+
+    provider = StubProvider()
+    summary = fill_missing(provider, str(locale_dir), str(patch_dir), cache=TranslationCache("stub", str(cache_dir)))
+    assert summary == {"fr": (2, 1)}
+    payload = json.loads((patch_dir / PATCH_SET_NAME / "fr.json").read_text(encoding="utf-8"))
+    assert payload == {"nav": {"contact": "[fr] Contact"}, "hero": {"cta": "[fr] Book now"}}
+
+    rerun = StubProvider()
+    summary = fill_missing(rerun, str(locale_dir), str(patch_dir), cache=TranslationCache("stub", str(cache_dir)))
+    assert rerun.calls == 0
+    assert summary["fr"][1] == 0
+
+
+def test_translations_changing_placeholders_are_dropped(site, tmp_path):
+    locale_dir, patch_dir = site
+    (locale_dir / "en.json").write_text(json.dumps({"greeting": "Hi {{name}}"}), encoding="utf-8")
+    (locale_dir / "fr.json").write_text("{}", encoding="utf-8")
+
+    class Broken(StubProvider):
+        name = "broken"
+
+        def translate(self, texts, source_lang, target_lang):
+            return ["Salut" for _ in texts]
+
+    summary = fill_missing(Broken(), str(locale_dir), str(patch_dir), cache=TranslationCache("broken", str(tmp_path)))
+    assert summary["fr"] == (0, 1)
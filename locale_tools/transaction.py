@@ -0,0 +1,154 @@
+"""
+Locked, all-or-nothing writes across the locale set.
+
+A run takes an advisory lock on ``.locale-tools.lock`` in the locale
+directory, so concurrent runs (two CI jobs, a dev server watcher) queue
+instead of interleaving. Outputs are staged to temp files next to their
+targets and fsynced. Commit then records the pending renames in
+``.locale-txn.json`` before renaming anything, so a crash half-way through
+is rolled forward by the next run; a crash before that record exists leaves
+every target untouched.
+"""
+
+import filecmp
+import json
+import os
+import time
+from contextlib import contextmanager
+
+LOCK_NAME = ".locale-tools.lock"
+TXN_NAME = ".locale-txn.json"
+TMP_SUFFIX = ".locale-tmp"
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _fsync_dir(path):
+    if fcntl is None:
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_synced(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+@contextmanager
+def locked(directory, timeout=None):
+    """Hold the advisory lock for a locale directory, waiting for other runs"""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, LOCK_NAME), "a+") as f:
+        waited = False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if deadline is not None and time.monotonic() > deadline:
+                    raise TimeoutError(f"{directory} is locked by another run") from None
+                if not waited:
+                    print("… Waiting for another locale run to finish")
+                    waited = True
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def interrupted(directory):
+    """True when a commit was interrupted and recover has not completed it yet"""
+    return os.path.exists(os.path.join(directory, TXN_NAME))
+
+
+def recover(directory):
+    """Finish a commit interrupted by a crash and drop orphaned temp files"""
+    recovered = []
+    txn_path = os.path.join(directory, TXN_NAME)
+    if os.path.exists(txn_path):
+        with open(txn_path, "r", encoding="utf-8") as f:
+            pending = json.load(f)
+        for tmp, target in pending:
+            if os.path.exists(tmp):
+                os.replace(tmp, target)
+                recovered.append(target)
+        _fsync_dir(directory)
+        os.remove(txn_path)
+
+    for dirpath, _, filenames in os.walk(directory):
+        for name in filenames:
+            if name.endswith(TMP_SUFFIX):
+                os.remove(os.path.join(dirpath, name))
+    return recovered
+
+
+class Transaction:
+    """Stage file contents and commit them together"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.staged = []
+
+    def stage(self, path, text):
+        tmp = f"{path}.{os.getpid()}{TMP_SUFFIX}"
+        _write_synced(tmp, text)
+        self.staged.append((tmp, path))
+
+    def stage_stream(self, path, write):
+        """
+        Stage whatever write(f) streams into the file, without holding it in
+        memory. Nothing is staged when it matches the target byte for byte;
+        returns whether it was staged.
+        """
+        tmp = f"{path}.{os.getpid()}{TMP_SUFFIX}"
+        with open(tmp, "w", encoding="utf-8") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path) and filecmp.cmp(tmp, path, shallow=False):
+            os.remove(tmp)
+            return False
+        self.staged.append((tmp, path))
+        return True
+
+    def commit(self):
+        if not self.staged:
+            return
+        txn_path = os.path.join(self.directory, TXN_NAME)
+        _write_synced(txn_path + TMP_SUFFIX, json.dumps(self.staged))
+        os.replace(txn_path + TMP_SUFFIX, txn_path)
+        _fsync_dir(self.directory)
+
+        for tmp, target in self.staged:
+            os.replace(tmp, target)
+        for directory in {os.path.dirname(target) for _, target in self.staged}:
+            _fsync_dir(directory)
+
+        os.remove(txn_path)
+        self.staged = []
+
+    def abort(self):
+        for tmp, _ in self.staged:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self.staged = []
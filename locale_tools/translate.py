@@ -0,0 +1,151 @@
+"""
+Machine translation of missing keys.
+
+A provider turns a batch of source strings into a batch of translations;
+``stub`` is a local, deterministic provider for tests, and any other one can
+be plugged in as ``module:Class``. Filling a language collects the source
+strings its locale is missing, looks each one up in the on-disk cache by
+(source hash, target language), and sends only the misses to the provider,
+in batches, over a bounded thread pool. Re-running therefore makes no calls
+for strings that were already translated.
+
+The translations are not written into the locale directly: they become the
+``machine_translations`` patch set under src/i18n/patches, which the next
+sync merges, journals and tracks for staleness like any other patch.
+"""
+
+import importlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import CACHE_DIR, LOCALE_DIR, PATCH_DIR, SOURCE_LANGUAGE
+from .engine import discover_languages, dump_locale, load_locale, locale_path, set_path, write_if_changed
+from .manifest import content_hash
+from .placeholders import placeholders_in
+
+PATCH_SET_NAME = "machine_translations"
+
+
+class StubProvider:
+    """Deterministic offline provider: tags each string with the target language"""
+
+    name = "stub"
+    batch_size = 50
+
+    def __init__(self):
+        self.calls = 0
+
+    def translate(self, texts, source_lang, target_lang):
+        self.calls += 1
+        return [f"[{target_lang}] {text}" for text in texts]
+
+
+PROVIDERS = {
+    "stub": StubProvider,
+}
+
+
+def make_provider(spec):
+    """A provider from its registered name or a 'module:Class' path"""
+    if spec in PROVIDERS:
+        return PROVIDERS[spec]()
+    module, _, name = spec.partition(":")
+    if not name:
+        raise ValueError(f"unknown provider {spec!r}, expected one of {', '.join(PROVIDERS)} or module:Class")
+    return getattr(importlib.import_module(module), name)()
+
+
+class TranslationCache:
+    """Translations on disk, one JSON file per provider and target language, keyed by source hash"""
+
+    def __init__(self, provider_name, cache_dir=os.path.join(CACHE_DIR, "translations")):
+        self.directory = os.path.join(cache_dir, provider_name)
+        self._entries = {}
+
+    def _path(self, lang):
+        return os.path.join(self.directory, f"{lang}.json")
+
+    def entries(self, lang):
+        if lang not in self._entries:
+            try:
+                with open(self._path(lang), "r", encoding="utf-8") as f:
+                    self._entries[lang] = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._entries[lang] = {}
+        return self._entries[lang]
+
+    def save(self, lang):
+        write_if_changed(self._path(lang), json.dumps(self.entries(lang), ensure_ascii=False, sort_keys=True))
+
+
+def missing_strings(source, target, prefix=()):
+    """(key path, source string) of every source string the target lacks"""
+    for key, value in source.items():
+        path = prefix + (key,)
+        if key not in target:
+            if isinstance(value, dict):
+                yield from missing_strings(value, {}, path)
+            elif isinstance(value, str):
+                yield path, value
+        elif isinstance(value, dict) and isinstance(target[key], dict):
+            yield from missing_strings(value, target[key], path)
+
+
+def _batches(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def translate_language(provider, cache, source, target, source_lang, target_lang, jobs=4):
+    """
+    Translate the strings target is missing. Returns the nested payload of
+    translations and the number of provider calls made.
+    """
+    missing = list(missing_strings(source, target))
+    cached = cache.entries(target_lang)
+    todo = sorted({text for _, text in missing if content_hash(text) not in cached})
+
+    calls = 0
+    if todo:
+        batches = list(_batches(todo, provider.batch_size))
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(batches)))) as pool:
+            results = pool.map(lambda batch: provider.translate(batch, source_lang, target_lang), batches)
+            for batch, translated in zip(batches, results):
+                calls += 1
+                if len(translated) != len(batch):
+                    raise ValueError(f"{provider.name}: sent {len(batch)} strings, got {len(translated)} back")
+                for text, translation in zip(batch, translated):
+                    if placeholders_in(translation) != placeholders_in(text):
+                        print(f"⚠ {target_lang}: dropped translation of {text!r}, placeholders changed")
+                        continue
+                    cached[content_hash(text)] = translation
+        cache.save(target_lang)
+
+    payload = {}
+    for path, text in missing:
+        translation = cached.get(content_hash(text))
+        if translation is not None:
+            set_path(payload, path, translation)
+    return payload, calls
+
+
+def fill_missing(provider, locale_dir=LOCALE_DIR, patch_dir=PATCH_DIR, languages=None,
+                 source_lang=SOURCE_LANGUAGE, jobs=4, cache=None):
+    """
+    Machine-translate every language's missing keys into the
+    machine_translations patch set. Returns {lang: (strings, calls)}.
+    """
+    cache = cache or TranslationCache(provider.name)
+    source = load_locale(locale_path(source_lang, locale_dir))
+    out_dir = os.path.join(patch_dir, PATCH_SET_NAME)
+    summary = {}
+    for lang in languages or discover_languages(locale_dir):
+        if lang == source_lang:
+            continue
+        target = load_locale(locale_path(lang, locale_dir))
+        payload, calls = translate_language(provider, cache, source, target, source_lang, lang, jobs)
+        if payload:
+            write_if_changed(os.path.join(out_dir, f"{lang}.json"), dump_locale(payload))
+        summary[lang] = (sum(1 for _ in missing_strings(payload, {})), calls)
+    return summary
@@ -0,0 +1,237 @@
+"""
+Watch mode.
+
+Watches the patch set payloads, the ``<lang>-<name>-update.json`` fragments
+and the locale directory, via inotify on Linux or by polling elsewhere, and
+redoes only the work a change affects:
+
+* a payload ``<patch set>/<lang>.json`` changed - sync that language; the
+  journal limits the work to the patch sets whose operations changed;
+* a fragment changed - sync just that fragment's language;
+* a locale was edited by hand - re-check its placeholders and, with
+  namespace output enabled, rewrite only its changed namespace chunks.
+
+Patch set directories created while the watcher runs, such as the
+``machine_translations`` set ``translate`` writes, are picked up as well.
+Files the watcher wrote itself are recognised by content hash and ignored.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+from .config import LOCALE_DIR, PATCH_DIR, SOURCE_LANGUAGE
+from .engine import LOCALE_FILE_RE, discover_languages, load_locale, locale_path, sync
+from .manifest import file_hash
+from .patches import FRAGMENT_RE, PAYLOAD_RE
+from .placeholders import compare_placeholders, describe, extract_placeholders
+from .split import load_split_manifest, save_split_manifest, split_language
+
+DEBOUNCE = 0.05
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def _files_in(directory):
+    try:
+        return {entry.path for entry in os.scandir(directory) if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+class InotifyWatcher:
+    """
+    Directory watcher on top of the Linux inotify syscalls. Subdirectories
+    created in one of the parents are watched from then on.
+    """
+
+    def __init__(self, directories, parents=()):
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.parents = {os.path.abspath(parent) for parent in parents}
+        self.dirs = {}
+        for directory in set(directories) | self.parents:
+            self.add(directory)
+
+    def add(self, directory):
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+        self.dirs[wd] = directory
+
+    def wait(self, timeout=None):
+        """Block until something changes; return the set of changed paths"""
+        changed = set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        while ready:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if not name or wd not in self.dirs:
+                    continue
+                path = os.path.join(self.dirs[wd], os.fsdecode(name))
+                changed.add(path)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and self.dirs[wd] in self.parents:
+                    self.add(path)
+                    # Files written before the watch existed produced no event
+                    changed.update(_files_in(path))
+            # Coalesce the burst of events an editor save produces
+            ready, _, _ = select.select([self.fd], [], [], DEBOUNCE)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback watcher comparing file mtimes and sizes every interval"""
+
+    def __init__(self, directories, parents=(), interval=0.25):
+        self.directories = list(directories)
+        self.parents = list(parents)
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        directories = set(self.directories)
+        for parent in self.parents:
+            if os.path.isdir(parent):
+                directories.update(entry.path for entry in os.scandir(parent) if entry.is_dir())
+        snapshot = {}
+        for directory in directories:
+            for path in _files_in(directory):
+                stat = os.stat(path)
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval)
+            current = self._scan()
+            changed = {path for path in current.keys() | self.snapshot.keys()
+                       if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+def make_watcher(directories, polling=False, parents=()):
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directories, parents)
+        except OSError as e:
+            print(f"⚠ inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(directories, parents)
+
+
+class Watch:
+    """Maps changed files to the smallest amount of work that handles them"""
+
+    def __init__(self, locale_dir=LOCALE_DIR, patch_dir=PATCH_DIR, out_dir=None, source_lang=SOURCE_LANGUAGE,
+                 **sync_options):
+        self.locale_dir = os.path.abspath(locale_dir)
+        self.patch_dir = os.path.abspath(patch_dir)
+        self.out_dir = out_dir
+        self.source_lang = source_lang
+        self.sync_options = sync_options
+        self.known = {}
+
+    def remember(self, languages):
+        for lang in languages:
+            self.known[locale_path(lang, self.locale_dir)] = file_hash(locale_path(lang, self.locale_dir))
+
+    def _sync(self, languages=None):
+        report = sync(self.locale_dir, languages=languages, patch_dir=self.patch_dir, **self.sync_options)
+        if not report.written and not report.invalid:
+            print("✓ Patch sets already applied, no locale changes")
+        self.remember(report.written)
+        for lang in report.written:
+            self._locale_changed(lang)
+
+    def _locale_changed(self, lang):
+        data = load_locale(locale_path(lang, self.locale_dir))
+        if lang != self.source_lang:
+            source = extract_placeholders(load_locale(locale_path(self.source_lang, self.locale_dir)))
+            for path, mismatch in compare_placeholders(source, extract_placeholders(data)).items():
+                print(f"⚠ {lang}.json: {describe(path, mismatch)}")
+
+        if self.out_dir:
+            manifest = load_split_manifest(self.out_dir)
+            entries, rewritten = split_language(lang, self.locale_dir, self.out_dir, data)
+            manifest["languages"][lang] = entries
+            save_split_manifest(manifest, self.out_dir)
+            if rewritten:
+                print(f"✓ Rewrote {lang}/{', '.join(rewritten)} chunks")
+
+    def handle(self, paths):
+        """React to a batch of changed paths"""
+        patched, edited = set(), set()
+        for path in paths:
+            directory, name = os.path.split(os.path.abspath(path))
+            if os.path.dirname(directory) == self.patch_dir and PAYLOAD_RE.match(name):
+                patched.add(PAYLOAD_RE.match(name).group(1))
+            elif directory != self.locale_dir:
+                continue
+            elif FRAGMENT_RE.match(name):
+                patched.add(FRAGMENT_RE.match(name).group(1))
+            elif LOCALE_FILE_RE.match(name) and os.path.exists(path):
+                if file_hash(path) != self.known.get(path):
+                    edited.add(LOCALE_FILE_RE.match(name).group(1))
+
+        if patched:
+            self._sync(sorted(patched))
+        for lang in sorted(edited - patched):
+            self.remember([lang])
+            self._locale_changed(lang)
+        return bool(patched or edited)
+
+
+def watched_directories(locale_dir, patch_dir):
+    directories = {os.path.abspath(locale_dir)}
+    if os.path.isdir(patch_dir):
+        directories.update(entry.path for entry in os.scandir(os.path.abspath(patch_dir)) if entry.is_dir())
+    return directories
+
+
+def watch(locale_dir=LOCALE_DIR, patch_dir=PATCH_DIR, out_dir=None, polling=False, **sync_options):
+    """Run until interrupted, re-applying only what each change affects"""
+    handler = Watch(locale_dir, patch_dir, out_dir, **sync_options)
+    handler.remember(discover_languages(locale_dir))
+    parents = [os.path.abspath(patch_dir)] if os.path.isdir(patch_dir) else []
+    watcher = make_watcher(watched_directories(locale_dir, patch_dir), polling, parents)
+    print(f"Watching {patch_dir} and {locale_dir} with {type(watcher).__name__} (Ctrl+C to stop)")
+    try:
+        while True:
+            changed = watcher.wait()
+            start = time.perf_counter()
+            if handler.handle(changed):
+                print(f"  handled in {(time.perf_counter() - start) * 1000:.1f} ms")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
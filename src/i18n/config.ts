@@ -27,7 +27,8 @@ i18n
     fallbackLng: 'en',
     supportedLngs: ['en', 'es', 'fr', 'ca', 'nl', 'it', 'de', 'pt'],
     detection: {
-      order: ['navigator', 'localStorage', 'htmlTag', 'path', 'subdomain'],
+      order: ['querystring', 'navigator', 'localStorage', 'htmlTag', 'path', 'subdomain'],
+      lookupQuerystring: 'lang',
       caches: ['localStorage'],
       convertDetectedLanguage: (lng: string) => {
         return lng.split('-')[0].toLowerCase();